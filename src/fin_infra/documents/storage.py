@@ -36,9 +36,15 @@ Quick Start:
 
 from __future__ import annotations
 
+import asyncio
+import sys
+from collections.abc import Sequence
 from typing import TYPE_CHECKING
 
 try:
+    from svc_infra.documents import (
+        clear_storage as base_clear_storage,
+    )
     from svc_infra.documents import (
         delete_document as base_delete_document,
     )
@@ -59,16 +65,70 @@ try:
 except ImportError:
     # Fallback for older svc-infra versions - use legacy implementation
     HAS_SVC_INFRA_DOCUMENTS = False
+    base_clear_storage = None  # type: ignore
     base_delete_document = None  # type: ignore
     base_download_document = None  # type: ignore
     base_get_document = None  # type: ignore
     base_list_documents = None  # type: ignore
     base_upload_document = None  # type: ignore
 
+from .models import DocumentType, FinancialDocument
+
 if TYPE_CHECKING:
+    from svc_infra.documents import Document as BaseDocument
     from svc_infra.storage.base import StorageBackend
 
-    from .models import DocumentType, FinancialDocument
+# Content types for the file formats financial documents usually arrive in. Passing
+# these to svc-infra skips its mimetypes.guess_type lookup; other extensions are left
+# for svc-infra to detect.
+_CONTENT_TYPES: dict[str, str] = {
+    "pdf": "application/pdf",
+    "jpg": "image/jpeg",
+    "jpeg": "image/jpeg",
+    "png": "image/png",
+    "gif": "image/gif",
+    "tif": "image/tiff",
+    "tiff": "image/tiff",
+    "heic": "image/heic",
+    "csv": "text/csv",
+    "txt": "text/plain",
+    "xml": "application/xml",
+    "json": "application/json",
+    "xls": "application/vnd.ms-excel",
+    "xlsx": "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+    "doc": "application/msword",
+    "docx": "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+}
+
+# Lookup table for the document_type metadata value; unknown values map to OTHER
+_DOCUMENT_TYPES: dict[str, DocumentType] = {t.value: t for t in DocumentType}
+
+
+def _content_type(filename: str) -> str | None:
+    """Content type for a filename's extension, or None to let svc-infra detect it."""
+    _, dot, ext = filename.rpartition(".")
+    return _CONTENT_TYPES.get(ext.lower()) if dot else None
+
+
+def _financial_fields(metadata: dict) -> tuple[DocumentType, int | None]:
+    """Decode the filterable financial fields (type, tax_year) from base metadata."""
+    raw_type = metadata.get("document_type")
+    # Metadata is caller-supplied; a list/dict value would be unhashable for the lookup
+    if not isinstance(raw_type, str):
+        return DocumentType.OTHER, metadata.get("tax_year")
+    return _DOCUMENT_TYPES.get(raw_type, DocumentType.OTHER), metadata.get("tax_year")
+
+
+def _to_financial_document(
+    base_doc: BaseDocument, doc_type: DocumentType, tax_year: int | None
+) -> FinancialDocument:
+    """Materialize a FinancialDocument from a base document and its decoded fields."""
+    return FinancialDocument(
+        **base_doc.model_dump(),
+        type=doc_type,
+        tax_year=tax_year,
+        form_type=base_doc.metadata.get("form_type"),
+    )
 
 
 async def upload_document(
@@ -118,10 +178,8 @@ async def upload_document(
         - Adds financial-specific fields (type, tax_year, form_type)
         - Uses svc-infra storage backend (S3/local/memory)
     """
-    from .models import FinancialDocument
-
-    # Merge financial metadata into base metadata
-    merged_metadata = metadata or {}
+    # Merge financial metadata into a copy of base metadata (caller's dict is not mutated)
+    merged_metadata = dict(metadata) if metadata else {}
     merged_metadata["document_type"] = document_type.value
     if tax_year:
         merged_metadata["tax_year"] = tax_year
@@ -135,6 +193,7 @@ async def upload_document(
         file=file,
         filename=filename,
         metadata=merged_metadata,
+        content_type=_content_type(filename),
     )
 
     # Convert to FinancialDocument with financial-specific fields
@@ -148,6 +207,67 @@ async def upload_document(
     return financial_doc
 
 
+async def upload_documents(
+    storage: StorageBackend,
+    user_id: str,
+    files: Sequence[tuple[bytes, DocumentType, str, dict | None]],
+) -> list[FinancialDocument]:
+    """
+    Upload several financial documents for one user in a single call.
+
+    Uploads run concurrently against the storage backend, so a batch costs roughly
+    one round-trip instead of one per file on remote backends (S3).
+
+    Args:
+        storage: Storage backend instance
+        user_id: User uploading the documents
+        files: (file, document_type, filename, metadata) tuples; ``tax_year`` and
+            ``form_type`` are taken from each item's metadata when present
+
+    Returns:
+        FinancialDocuments in the same order as ``files``
+
+    Examples:
+        >>> docs = await upload_documents(
+        ...     storage=storage,
+        ...     user_id="user_123",
+        ...     files=[
+        ...         (w2_bytes, DocumentType.TAX, "w2_2024.pdf", {"tax_year": 2024}),
+        ...         (receipt_bytes, DocumentType.RECEIPT, "receipt.jpg", None),
+        ...     ],
+        ... )
+
+    Notes:
+        - Each item goes through upload_document (svc-infra assigns ids and checksums)
+        - If any upload fails, the uploads still in flight are cancelled and awaited,
+          then the first error propagates. Uploads that already finished are kept,
+          not rolled back.
+    """
+    tasks = [
+        asyncio.ensure_future(
+            upload_document(
+                storage=storage,
+                user_id=user_id,
+                file=file,
+                document_type=document_type,
+                filename=filename,
+                metadata=metadata,
+                tax_year=metadata.get("tax_year") if metadata else None,
+                form_type=metadata.get("form_type") if metadata else None,
+            )
+        )
+        for file, document_type, filename, metadata in files
+    ]
+    try:
+        return list(await asyncio.gather(*tasks))
+    except BaseException:
+        # gather leaves the other uploads running; stop them before surfacing the error
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+
+
 def get_document(document_id: str) -> FinancialDocument | None:
     """
     Get financial document metadata by ID (delegates to svc-infra).
@@ -168,31 +288,12 @@ def get_document(document_id: str) -> FinancialDocument | None:
         - Converts base Document to FinancialDocument
         - Extracts financial fields from metadata if present
     """
-    from .models import DocumentType, FinancialDocument
-
     base_doc = base_get_document(document_id)
     if not base_doc:
         return None
 
-    # Extract financial fields from metadata
-    doc_type_str = base_doc.metadata.get("document_type", "other")
-    tax_year = base_doc.metadata.get("tax_year")
-    form_type = base_doc.metadata.get("form_type")
-
-    # Convert to FinancialDocument
-    try:
-        doc_type = DocumentType(doc_type_str)
-    except ValueError:
-        doc_type = DocumentType.OTHER
-
-    financial_doc = FinancialDocument(
-        **base_doc.model_dump(),
-        type=doc_type,
-        tax_year=tax_year,
-        form_type=form_type,
-    )
-
-    return financial_doc
+    doc_type, tax_year = _financial_fields(base_doc.metadata)
+    return _to_financial_document(base_doc, doc_type, tax_year)
 
 
 async def download_document(storage: StorageBackend, document_id: str) -> bytes:
@@ -281,25 +382,23 @@ def list_documents(
     Notes:
         - Delegates to svc-infra.documents.list_documents
         - Applies financial-specific filters on top of base results
+        - With filters, limit/offset paginate the filtered results
         - Converts base Documents to FinancialDocuments
     """
-    from .models import DocumentType, FinancialDocument
-
-    # Get all user documents from svc-infra
-    base_docs = base_list_documents(user_id=user_id, limit=limit, offset=offset)
-
-    # Convert to FinancialDocuments and apply filters
-    financial_docs = []
+    if document_type is None and tax_year is None:
+        # No financial filters: svc-infra's per-user listing already paginates
+        base_docs = base_list_documents(user_id=user_id, limit=limit, offset=offset)
+        return [_to_financial_document(d, *_financial_fields(d.metadata)) for d in base_docs]
+
+    # Filters apply to the user's whole listing, so paginate over matches rather than
+    # over the base page (which would drop matches beyond the first `limit` docs)
+    base_docs = base_list_documents(user_id=user_id, limit=sys.maxsize, offset=0)
+
+    # Filter on the decoded financial fields first; only the requested page is materialized
+    financial_docs: list[FinancialDocument] = []
+    skipped = 0
     for base_doc in base_docs:
-        # Extract financial fields from metadata
-        doc_type_str = base_doc.metadata.get("document_type", "other")
-        year = base_doc.metadata.get("tax_year")
-        form = base_doc.metadata.get("form_type")
-
-        try:
-            doc_type = DocumentType(doc_type_str)
-        except ValueError:
-            doc_type = DocumentType.OTHER
+        doc_type, year = _financial_fields(base_doc.metadata)
 
         # Apply filters
         if document_type is not None and doc_type != document_type:
@@ -307,14 +406,13 @@ def list_documents(
         if tax_year is not None and year != tax_year:
             continue
 
-        # Convert to FinancialDocument
-        financial_doc = FinancialDocument(
-            **base_doc.model_dump(),
-            type=doc_type,
-            tax_year=year,
-            form_type=form,
-        )
-        financial_docs.append(financial_doc)
+        if skipped < offset:
+            skipped += 1
+            continue
+
+        financial_docs.append(_to_financial_document(base_doc, doc_type, year))
+        if len(financial_docs) >= limit:
+            break
 
     return financial_docs
 
@@ -332,6 +430,4 @@ def clear_storage() -> None:
         - Only for testing - DO NOT use in production
         - Delegates to svc-infra.documents.clear_storage
     """
-    from svc_infra.documents import clear_storage as base_clear_storage
-
     base_clear_storage()
@@ -22,15 +22,18 @@ from fin_infra.goals.management import (
     calculate_retirement_goal,
     calculate_wealth_milestone,
     create_goal,
+    create_goals,
     delete_goal,
     get_goal,
     get_goal_progress,
+    iter_goals,
     list_goals,
     update_goal,
 )
 from fin_infra.goals.milestones import (
     add_milestone,
     check_milestones,
+    check_milestones_for_user,
     get_celebration_message,
     get_milestone_progress,
     get_next_milestone,
@@ -56,14 +59,17 @@ __all__ = [
     "calculate_wealth_milestone",
     # CRUD operations (from management.py)
     "create_goal",
+    "create_goals",
     "delete_goal",
     "get_goal",
     "get_goal_progress",
+    "iter_goals",
     "list_goals",
     "update_goal",
     # Milestone tracking (from milestones.py)
     "add_milestone",
     "check_milestones",
+    "check_milestones_for_user",
     "get_celebration_message",
     "get_milestone_progress",
     "get_next_milestone",
@@ -22,12 +22,83 @@ Example:
     >>> # Raises ValueError if total allocation > 100%
 """
 
+import math
+import threading
+
 from fin_infra.goals.management import get_goal
 from fin_infra.goals.models import FundingSource
 
-# In-memory storage for funding allocations
-# Structure: {account_id: {goal_id: allocation_percent}}
-_FUNDING_STORE: dict[str, dict[str, float]] = {}
+# In-memory storage for funding allocations, in integer basis points (1/100 of a
+# percent) so comparisons and sums are exact; converted to float percent on the way out.
+# Structure: {account_id: {goal_id: allocation_basis_points}}
+_FUNDING_STORE: dict[str, dict[str, int]] = {}
+
+# Running allocation total per account in basis points.
+# Maintained on link/update/remove so the 100% check is O(1) and exact in integers.
+# Structure: {account_id: total_basis_points}
+_ACCOUNT_TOTALS: dict[str, int] = {}
+
+_FULL_ALLOCATION_BP = 10_000
+
+# Guards the check-then-write on _FUNDING_STORE and _ACCOUNT_TOTALS so concurrent
+# callers cannot both pass the 100% check; held once per mutation
+_FUNDING_LOCK = threading.RLock()
+
+
+def _to_basis_points(allocation_percent: float) -> int:
+    """Convert an allocation percentage to integer basis points."""
+    return round(allocation_percent * 100)
+
+
+def _to_percent(allocation_bp: int) -> float:
+    """Convert integer basis points back to an allocation percentage."""
+    return allocation_bp / 100
+
+
+def _validate_allocation(allocation_percent: float) -> int:
+    """
+    Convert an allocation to basis points and check it is in (0, 100%].
+
+    The check runs on the stored basis points, so an allocation that rounds to
+    0.00% is rejected rather than silently stored as zero.
+
+    Raises:
+        ValueError: Allocation is NaN, rounds to 0 or below, or exceeds 100%
+    """
+    if math.isnan(allocation_percent):
+        raise ValueError(f"Allocation must be a number, got {allocation_percent}")
+    # round() overflows on an infinite scaled value, so bound those by sign instead
+    if not math.isfinite(allocation_percent * 100):
+        allocation_bp = _FULL_ALLOCATION_BP + 1 if allocation_percent > 0 else 0
+    else:
+        allocation_bp = _to_basis_points(allocation_percent)
+    if allocation_bp <= 0:
+        raise ValueError(f"Allocation must be positive (at least 0.01%), got {allocation_percent}")
+    if allocation_bp > _FULL_ALLOCATION_BP:
+        raise ValueError(f"Allocation cannot exceed 100%, got {allocation_percent}")
+    return allocation_bp
+
+
+def _check_account_total(account_id: str, goal_id: str, allocation_bp: int) -> int:
+    """
+    Validate that setting goal_id's allocation keeps the account total <= 100%.
+
+    Returns:
+        The account total in basis points once the allocation is applied
+
+    Raises:
+        ValueError: Total allocation for the account would exceed 100%
+    """
+    current_bp = _ACCOUNT_TOTALS.get(account_id, 0)
+    current_bp -= _FUNDING_STORE.get(account_id, {}).get(goal_id, 0)
+
+    new_total_bp = current_bp + allocation_bp
+    if new_total_bp > _FULL_ALLOCATION_BP:
+        raise ValueError(
+            f"Total allocation for account {account_id} would exceed 100% "
+            f"(current: {_to_percent(current_bp)}%, adding: {_to_percent(allocation_bp)}%)"
+        )
+    return new_total_bp
 
 
 def link_account_to_goal(
@@ -40,14 +111,14 @@ def link_account_to_goal(
 
     Validates:
     - Goal exists (raises KeyError if not)
-    - Allocation is positive (raises ValueError if <= 0)
+    - Allocation is positive once rounded to 0.01% (raises ValueError if <= 0)
     - Total allocation for account <= 100% (raises ValueError if over)
     - Allocation is <= 100% (raises ValueError if > 100)
 
     Args:
         goal_id: Goal identifier
         account_id: Account identifier
-        allocation_percent: Percentage of account to allocate (0-100)
+        allocation_percent: Percentage of account to allocate (0-100), kept to 0.01%
 
     Returns:
         FundingSource with allocation details
@@ -74,34 +145,20 @@ def link_account_to_goal(
     get_goal(goal_id)  # Raises KeyError if not found
 
     # Validate allocation
-    if allocation_percent <= 0:
-        raise ValueError(f"Allocation must be positive, got {allocation_percent}")
-
-    if allocation_percent > 100:
-        raise ValueError(f"Allocation cannot exceed 100%, got {allocation_percent}")
-
-    # Check total allocation for account
-    if account_id not in _FUNDING_STORE:
-        _FUNDING_STORE[account_id] = {}
+    allocation_bp = _validate_allocation(allocation_percent)
+    with _FUNDING_LOCK:
+        # Check total allocation for account
+        new_total_bp = _check_account_total(account_id, goal_id, allocation_bp)
 
-    current_allocations = _FUNDING_STORE[account_id]
-    current_total = sum(pct for gid, pct in current_allocations.items() if gid != goal_id)
-    new_total = current_total + allocation_percent
-
-    if new_total > 100:
-        raise ValueError(
-            f"Total allocation for account {account_id} would exceed 100% "
-            f"(current: {current_total}%, adding: {allocation_percent}%)"
-        )
-
-    # Store allocation
-    _FUNDING_STORE[account_id][goal_id] = allocation_percent
+        # Store allocation
+        _FUNDING_STORE.setdefault(account_id, {})[goal_id] = allocation_bp
+        _ACCOUNT_TOTALS[account_id] = new_total_bp
 
     # Create FundingSource
     return FundingSource(
         goal_id=goal_id,
         account_id=account_id,
-        allocation_percent=allocation_percent,
+        allocation_percent=_to_percent(allocation_bp),
         account_name=None,  # Would come from banking provider in real impl
     )
 
@@ -144,7 +201,7 @@ def get_goal_funding_sources(goal_id: str) -> list[FundingSource]:
                 FundingSource(
                     goal_id=goal_id,
                     account_id=account_id,
-                    allocation_percent=allocations[goal_id],
+                    allocation_percent=_to_percent(allocations[goal_id]),
                     account_name=None,
                 )
             )
@@ -174,7 +231,7 @@ def get_account_allocations(account_id: str) -> dict[str, float]:
         >>> sum(allocations.values())
         80.0
     """
-    return _FUNDING_STORE.get(account_id, {}).copy()
+    return {gid: _to_percent(bp) for gid, bp in _FUNDING_STORE.get(account_id, {}).items()}
 
 
 def update_account_allocation(
@@ -190,7 +247,7 @@ def update_account_allocation(
     Args:
         goal_id: Goal identifier
         account_id: Account identifier
-        new_allocation_percent: New percentage (0-100)
+        new_allocation_percent: New percentage (0-100), kept to 0.01%
 
     Returns:
         Updated FundingSource
@@ -211,35 +268,25 @@ def update_account_allocation(
     # Validate goal exists
     get_goal(goal_id)
 
-    # Validate funding source exists
-    if account_id not in _FUNDING_STORE or goal_id not in _FUNDING_STORE[account_id]:
-        raise KeyError(f"No funding source found for goal {goal_id} from account {account_id}")
+    with _FUNDING_LOCK:
+        # Validate funding source exists
+        if account_id not in _FUNDING_STORE or goal_id not in _FUNDING_STORE[account_id]:
+            raise KeyError(f"No funding source found for goal {goal_id} from account {account_id}")
 
-    # Validate new allocation
-    if new_allocation_percent <= 0:
-        raise ValueError(f"Allocation must be positive, got {new_allocation_percent}")
+        # Validate new allocation
+        allocation_bp = _validate_allocation(new_allocation_percent)
 
-    if new_allocation_percent > 100:
-        raise ValueError(f"Allocation cannot exceed 100%, got {new_allocation_percent}")
-
-    # Check total allocation for account (excluding current allocation)
-    current_allocations = _FUNDING_STORE[account_id]
-    current_total = sum(pct for gid, pct in current_allocations.items() if gid != goal_id)
-    new_total = current_total + new_allocation_percent
-
-    if new_total > 100:
-        raise ValueError(
-            f"Total allocation for account {account_id} would exceed 100% "
-            f"(current: {current_total}%, adding: {new_allocation_percent}%)"
-        )
+        # Check total allocation for account (excluding current allocation)
+        new_total_bp = _check_account_total(account_id, goal_id, allocation_bp)
 
-    # Update allocation
-    _FUNDING_STORE[account_id][goal_id] = new_allocation_percent
+        # Update allocation
+        _FUNDING_STORE[account_id][goal_id] = allocation_bp
+        _ACCOUNT_TOTALS[account_id] = new_total_bp
 
     return FundingSource(
         goal_id=goal_id,
         account_id=account_id,
-        allocation_percent=new_allocation_percent,
+        allocation_percent=_to_percent(allocation_bp),
         account_name=None,
     )
 
@@ -270,21 +317,25 @@ def remove_account_from_goal(goal_id: str, account_id: str) -> None:
     # Validate goal exists
     get_goal(goal_id)
 
-    # Validate funding source exists
-    if account_id not in _FUNDING_STORE or goal_id not in _FUNDING_STORE[account_id]:
-        raise KeyError(f"No funding source found for goal {goal_id} from account {account_id}")
+    with _FUNDING_LOCK:
+        # Validate funding source exists
+        if account_id not in _FUNDING_STORE or goal_id not in _FUNDING_STORE[account_id]:
+            raise KeyError(f"No funding source found for goal {goal_id} from account {account_id}")
 
-    # Remove allocation
-    del _FUNDING_STORE[account_id][goal_id]
+        # Remove allocation
+        _ACCOUNT_TOTALS[account_id] -= _FUNDING_STORE[account_id].pop(goal_id)
 
-    # Clean up empty account entries
-    if not _FUNDING_STORE[account_id]:
-        del _FUNDING_STORE[account_id]
+        # Clean up empty account entries
+        if not _FUNDING_STORE[account_id]:
+            del _FUNDING_STORE[account_id]
+            del _ACCOUNT_TOTALS[account_id]
 
 
 def clear_funding_store() -> None:
-    """Clear all funding allocations (for testing)."""
-    _FUNDING_STORE.clear()
+    """Clear all funding allocations and account totals (for testing)."""
+    with _FUNDING_LOCK:
+        _FUNDING_STORE.clear()
+        _ACCOUNT_TOTALS.clear()
 
 
 __all__ = [
@@ -40,9 +40,14 @@ Example:
     print(progress.status)  # "on_track" | "ahead" | "behind" | "off_track"
 """
 
+import itertools
+import secrets
+import sys
+from collections.abc import Iterator, Sequence
 from datetime import datetime
 from typing import Any, cast
 
+import numpy as np
 from pydantic import BaseModel, Field
 
 # ============================================================================
@@ -691,6 +696,43 @@ Provide course corrections if behind."""
 # Applications should use svc-infra DB (SQL/Mongo) for persistence
 _GOALS_STORE: dict[str, Any] = {}
 
+# Secondary index: user_id -> {goal_id: creation sequence}, insertion-ordered, so
+# list_goals visits only that user's goals. user_id is immutable via update_goal.
+_GOALS_BY_USER: dict[str, dict[str, int]] = {}
+
+# Composite index: (user_id, type, status) -> goal ids, so the common fully-filtered
+# list_goals query is a single lookup. Keys hold plain strings: str-Enum members hash
+# by name, so GoalType.SAVINGS and "savings" would land in different buckets.
+# Values are creation sequences: a goal moved back into a bucket by update_goal is
+# re-appended at the end, so iter_goals sorts on them to keep creation order.
+_GOALS_BY_USER_TYPE_STATUS: dict[tuple[str, str, str], dict[str, int]] = {}
+
+# Goal ids are a per-process random prefix plus a counter: unique without a clock
+# read or entropy draw per goal (timestamps collided for goals created in the same tick)
+_GOAL_ID_PREFIX = secrets.token_hex(4)
+_GOAL_ID_COUNTER = itertools.count()
+
+# Fields update_goal never overwrites
+_IMMUTABLE_GOAL_FIELDS = frozenset({"id", "user_id", "created_at"})
+
+# create_goal arguments every create_goals spec must supply
+_GOAL_SPEC_REQUIRED_KEYS = frozenset({"name", "goal_type", "target_amount"})
+
+
+def _enum_value(value: Any) -> Any:
+    return getattr(value, "value", value)
+
+
+def _filter_key(goal: dict[str, Any]) -> tuple[str, str, str]:
+    return (goal["user_id"], _enum_value(goal["type"]), _enum_value(goal["status"]))
+
+
+def _unindex_filter_key(key: tuple[str, str, str], goal_id: str) -> None:
+    bucket = _GOALS_BY_USER_TYPE_STATUS[key]
+    del bucket[goal_id]
+    if not bucket:
+        del _GOALS_BY_USER_TYPE_STATUS[key]
+
 
 def create_goal(
     user_id: str,
@@ -743,7 +785,8 @@ def create_goal(
     """
     from fin_infra.goals.models import Goal, GoalStatus, GoalType
 
-    goal_id = f"goal_{user_id}_{datetime.utcnow().timestamp()}"
+    seq = next(_GOAL_ID_COUNTER)
+    goal_id = f"goal_{user_id}_{_GOAL_ID_PREFIX}{seq:08x}"
 
     # Create Goal model instance for validation
     goal = Goal(
@@ -765,42 +808,141 @@ def create_goal(
 
     # Store as dict
     goal_dict = goal.model_dump()
+
+    # Goal type and status are stored as enum singletons; interning the validated
+    # user_id lets every goal dict and index entry for a user share one string object
+    user_id = goal_dict["user_id"] = sys.intern(goal.user_id)
     _GOALS_STORE[goal_id] = goal_dict
+    _GOALS_BY_USER.setdefault(user_id, {})[goal_id] = seq
+    _GOALS_BY_USER_TYPE_STATUS.setdefault(_filter_key(goal_dict), {})[goal_id] = seq
 
     return goal_dict
 
 
-def list_goals(
+def _has_numeric_amounts(spec: dict[str, Any]) -> bool:
+    try:
+        float(spec["target_amount"])
+        float(spec.get("current_amount", 0.0))
+    except (TypeError, ValueError):
+        return False
+    return True
+
+
+def create_goals(user_id: str, goals: Sequence[dict[str, Any]]) -> list[dict[str, Any]]:
+    """
+    Create several goals for a user, all or nothing (e.g. for data imports).
+
+    Amounts for the whole batch are checked up front in a single vectorized pass,
+    so an invalid batch is rejected before any goal is stored. If a later goal
+    still fails validation, the goals already created by this call are removed.
+
+    Args:
+        user_id: User identifier
+        goals: Keyword arguments for create_goal, one dict per goal (without user_id)
+
+    Returns:
+        Created goal dicts, in input order
+
+    Raises:
+        ValueError: If any goal is missing name/goal_type/target_amount, has
+            non-numeric or invalid amounts, or fails validation
+
+    Example:
+        from fin_infra.goals.management import create_goals
+
+        goals = create_goals(
+            user_id="user_123",
+            goals=[
+                {"name": "Emergency Fund", "goal_type": "savings", "target_amount": 10000.0},
+                {"name": "Pay Off Card", "goal_type": "debt", "target_amount": 5000.0},
+            ],
+        )
+    """
+    missing = [i for i, g in enumerate(goals) if not g.keys() >= _GOAL_SPEC_REQUIRED_KEYS]
+    if missing:
+        raise ValueError(
+            f"Goals at indices {missing} are missing one of {sorted(_GOAL_SPEC_REQUIRED_KEYS)}"
+        )
+
+    count = len(goals)
+    try:
+        targets = np.fromiter((g["target_amount"] for g in goals), dtype=float, count=count)
+        currents = np.fromiter(
+            (g.get("current_amount", 0.0) for g in goals), dtype=float, count=count
+        )
+    except (TypeError, ValueError):
+        bad = [i for i, g in enumerate(goals) if not _has_numeric_amounts(g)]
+        raise ValueError(f"Non-numeric target/current amounts for goals at indices {bad}") from None
+    # fromiter reads None as NaN rather than raising
+    non_numeric = np.isnan(targets) | np.isnan(currents)
+    if non_numeric.any():
+        raise ValueError(
+            "Non-numeric target/current amounts for goals at indices "
+            f"{np.flatnonzero(non_numeric).tolist()}"
+        )
+
+    is_debt = np.fromiter((g["goal_type"] == "debt" for g in goals), dtype=bool, count=count)
+
+    # Same rules as the Goal model: debt goals may start above their target
+    invalid = (targets <= 0) | (currents < 0) | ((currents > targets) & ~is_debt)
+    if invalid.any():
+        raise ValueError(
+            f"Invalid target/current amounts for goals at indices {np.flatnonzero(invalid).tolist()}"
+        )
+
+    created: list[dict[str, Any]] = []
+    try:
+        for spec in goals:
+            created.append(create_goal(user_id=user_id, **spec))
+    except Exception:
+        for goal in created:
+            delete_goal(goal["id"])
+        raise
+
+    return created
+
+
+def iter_goals(
     user_id: str,
     goal_type: str | None = None,
     status: str | None = None,
-) -> list[dict[str, Any]]:
+) -> Iterator[dict[str, Any]]:
     """
-    List all goals for a user with optional filtering.
+    Iterate over a user's goals with optional filtering, without building a list.
+
+    Same filters and ordering as list_goals. Goals are yielded lazily, so callers
+    that stop early (e.g. ``any(...)`` or ``next(...)``) skip the remaining goals.
+    The matching goal ids are snapshotted when iteration starts, so goals may be
+    updated or deleted inside the loop: goals deleted or moved out of the filter
+    before they are reached are skipped, and goals created meanwhile are not yielded.
 
     Args:
         user_id: User identifier
         goal_type: Optional filter by goal type
         status: Optional filter by status
 
-    Returns:
-        List of goal dicts matching filters
+    Yields:
+        Goal dicts matching filters
 
     Example:
-        from fin_infra.goals.management import list_goals
+        from fin_infra.goals.management import iter_goals
 
-        # Get all active savings goals
-        goals = list_goals(
-            user_id="user_123",
-            goal_type="savings",
-            status="active"
+        has_active_savings = any(
+            iter_goals(user_id="user_123", goal_type="savings", status="active")
         )
     """
-    results = []
-
-    for goal in _GOALS_STORE.values():
-        # Filter by user
-        if goal["user_id"] != user_id:
+    if goal_type and status:
+        key = (user_id, _enum_value(goal_type), _enum_value(status))
+        bucket = _GOALS_BY_USER_TYPE_STATUS.get(key, {})
+        for goal_id in sorted(bucket, key=bucket.__getitem__):
+            # An update_goal/delete_goal inside the loop may have moved it out
+            if goal_id in bucket:
+                yield _GOALS_STORE[goal_id]
+        return
+
+    for goal_id in tuple(_GOALS_BY_USER.get(user_id, ())):
+        goal = _GOALS_STORE.get(goal_id)
+        if goal is None:
             continue
 
         # Filter by type if specified
@@ -811,9 +953,36 @@ def list_goals(
         if status and goal["status"] != status:
             continue
 
-        results.append(goal)
+        yield goal
 
-    return results
+
+def list_goals(
+    user_id: str,
+    goal_type: str | None = None,
+    status: str | None = None,
+) -> list[dict[str, Any]]:
+    """
+    List all goals for a user with optional filtering.
+
+    Args:
+        user_id: User identifier
+        goal_type: Optional filter by goal type
+        status: Optional filter by status
+
+    Returns:
+        List of goal dicts matching filters
+
+    Example:
+        from fin_infra.goals.management import list_goals
+
+        # Get all active savings goals
+        goals = list_goals(
+            user_id="user_123",
+            goal_type="savings",
+            status="active"
+        )
+    """
+    return list(iter_goals(user_id, goal_type=goal_type, status=status))
 
 
 def get_goal(goal_id: str) -> dict[str, Any]:
@@ -835,10 +1004,11 @@ def get_goal(goal_id: str) -> dict[str, Any]:
         goal = get_goal("goal_123")
         print(goal["name"])
     """
-    if goal_id not in _GOALS_STORE:
+    goal = _GOALS_STORE.get(goal_id)
+    if goal is None:
         raise KeyError(f"Goal not found: {goal_id}")
 
-    return cast("dict[str, Any]", _GOALS_STORE[goal_id])
+    return cast("dict[str, Any]", goal)
 
 
 def update_goal(
@@ -866,24 +1036,35 @@ def update_goal(
             {"current_amount": 15000.0, "status": "active"}
         )
     """
-    if goal_id not in _GOALS_STORE:
+    goal = _GOALS_STORE.get(goal_id)
+    if goal is None:
         raise KeyError(f"Goal not found: {goal_id}")
 
-    goal = _GOALS_STORE[goal_id]
+    old_key = _filter_key(goal)
 
     # Update fields
     for key, value in updates.items():
-        if key in goal and key not in ["id", "user_id", "created_at"]:
+        if key in goal and key not in _IMMUTABLE_GOAL_FIELDS:
             goal[key] = value
 
     # Update timestamp
     goal["updated_at"] = datetime.utcnow()
 
+    new_key = _filter_key(goal)
+    if new_key != old_key:
+        _unindex_filter_key(old_key, goal_id)
+        seq = _GOALS_BY_USER[goal["user_id"]][goal_id]
+        _GOALS_BY_USER_TYPE_STATUS.setdefault(new_key, {})[goal_id] = seq
+
     # Validate updated goal
     from fin_infra.goals.models import Goal
 
     Goal(**goal)  # Will raise ValidationError if invalid
 
+    # The milestone helpers bisect on amount, so keep the list sorted however it was written
+    if "milestones" in updates:
+        goal["milestones"] = sorted(goal["milestones"], key=lambda m: m["amount"])
+
     return cast("dict[str, Any]", goal)
 
 
@@ -902,10 +1083,15 @@ def delete_goal(goal_id: str) -> None:
 
         delete_goal("goal_123")
     """
-    if goal_id not in _GOALS_STORE:
+    goal = _GOALS_STORE.pop(goal_id, None)
+    if goal is None:
         raise KeyError(f"Goal not found: {goal_id}")
 
-    del _GOALS_STORE[goal_id]
+    user_goals = _GOALS_BY_USER[goal["user_id"]]
+    del user_goals[goal_id]
+    if not user_goals:
+        del _GOALS_BY_USER[goal["user_id"]]
+    _unindex_filter_key(_filter_key(goal), goal_id)
 
 
 def get_goal_progress(goal_id: str) -> dict[str, Any]:
@@ -944,6 +1130,7 @@ def get_goal_progress(goal_id: str) -> dict[str, Any]:
     from fin_infra.goals.models import GoalProgress, Milestone
 
     goal = get_goal(goal_id)
+    now = datetime.utcnow()
 
     # Calculate percent complete
     current = goal["current_amount"]
@@ -958,10 +1145,7 @@ def get_goal_progress(goal_id: str) -> dict[str, Any]:
             deadline = datetime.fromisoformat(deadline.replace("Z", "+00:00"))
 
         months_remaining = max(
-            (
-                (deadline.year - datetime.utcnow().year) * 12
-                + (deadline.month - datetime.utcnow().month)
-            ),
+            (deadline.year - now.year) * 12 + (deadline.month - now.month),
             1,
         )
         remaining_amount = target - current
@@ -975,13 +1159,10 @@ def get_goal_progress(goal_id: str) -> dict[str, Any]:
     # Project completion date
     if monthly_actual > 0:
         months_needed = (target - current) / monthly_actual
-        now = datetime.utcnow()
-        total_months = now.year * 12 + now.month + int(months_needed)
-        projected_year = total_months // 12
-        projected_month = (total_months % 12) or 12
-        if projected_month == 12:
-            projected_year -= 1
-        projected_date = now.replace(year=projected_year, month=projected_month, day=1)
+        # Months since year 0, shifted to a zero-based month so divmod gives year and month
+        total_months = now.year * 12 + (now.month - 1) + int(months_needed)
+        projected_year, projected_month_index = divmod(total_months, 12)
+        projected_date = now.replace(year=projected_year, month=projected_month_index + 1, day=1)
     else:
         projected_date = None
 
@@ -994,7 +1175,7 @@ def get_goal_progress(goal_id: str) -> dict[str, Any]:
         milestone = Milestone(**milestone_dict)
         if current >= milestone.amount and not milestone.reached:
             milestone.reached = True
-            milestone.reached_date = datetime.utcnow()
+            milestone.reached_date = now
             milestones_reached.append(milestone)
 
     # Create progress model
@@ -1014,5 +1195,13 @@ def get_goal_progress(goal_id: str) -> dict[str, Any]:
 
 
 def clear_goals_store() -> None:
-    """Clear all goals from storage (for testing)."""
+    """
+    Clear all goals from storage (for testing).
+
+    This is the single reset point for module-level goal state; any index or cache
+    derived from _GOALS_STORE must be cleared here too. Tests should call this rather
+    than clearing _GOALS_STORE directly.
+    """
     _GOALS_STORE.clear()
+    _GOALS_BY_USER.clear()
+    _GOALS_BY_USER_TYPE_STATUS.clear()
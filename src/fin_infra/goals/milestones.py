@@ -25,10 +25,11 @@ Example:
         print(f" Milestone reached: {m['description']}")
 """
 
+from bisect import bisect_left, bisect_right
 from datetime import datetime
 from typing import Any, cast
 
-from fin_infra.goals.management import get_goal, update_goal
+from fin_infra.goals.management import get_goal, iter_goals, update_goal
 from fin_infra.goals.models import Milestone
 
 # ============================================================================
@@ -88,17 +89,15 @@ def add_milestone(
             f"goal target ({goal['target_amount']})"
         )
 
-    # Check for duplicate milestone amounts
-    for existing in goal.get("milestones", []):
-        if existing["amount"] == milestone.amount:
-            raise ValueError(f"Milestone at ${milestone.amount:,.0f} already exists for this goal")
-
-    # Add to goal
+    # update_goal keeps milestones sorted by amount ascending, so a duplicate amount
+    # sits at the insertion point
     milestones = goal.get("milestones", [])
-    milestones.append(milestone.model_dump())
+    position = bisect_left(milestones, milestone.amount, key=lambda m: m["amount"])
+    if position < len(milestones) and milestones[position]["amount"] == milestone.amount:
+        raise ValueError(f"Milestone at ${milestone.amount:,.0f} already exists for this goal")
 
-    # Sort by amount ascending
-    milestones.sort(key=lambda m: m["amount"])
+    # Add to goal
+    milestones.insert(position, milestone.model_dump())
 
     update_goal(goal_id, {"milestones": milestones})
 
@@ -144,34 +143,70 @@ def check_milestones(goal_id: str) -> list[dict[str, Any]]:
                 }
             )
     """
-    goal = get_goal(goal_id)
-    current_amount = goal["current_amount"]
+    return _mark_reached_milestones(get_goal(goal_id))
 
-    newly_reached = []
-    milestones = goal.get("milestones", [])
-    updated = False
 
-    for milestone_dict in milestones:
-        milestone = Milestone(**milestone_dict)
+def check_milestones_for_user(user_id: str) -> dict[str, list[dict[str, Any]]]:
+    """
+    Check milestones across all of a user's goals in one pass.
 
-        # Check if milestone just reached
-        if not milestone.reached and current_amount >= milestone.amount:
-            milestone.reached = True
-            milestone.reached_date = datetime.utcnow()
+    Useful after a deposit that may move several goals at once. All milestones
+    reached in the batch share a single reached_date.
 
-            # Update dict
-            milestone_dict.update(milestone.model_dump())
+    Args:
+        user_id: User identifier
 
-            newly_reached.append(milestone_dict)
-            updated = True
+    Returns:
+        Dict of goal ID -> newly reached milestone dicts, only for goals
+        with at least one newly reached milestone
+
+    Example:
+        from fin_infra.goals.milestones import check_milestones_for_user
+
+        for goal_id, reached in check_milestones_for_user("user_123").items():
+            print(f"{goal_id}: {len(reached)} milestones reached")
+    """
+    reached_date = datetime.utcnow()
+    results = {}
+    for goal in iter_goals(user_id):
+        newly_reached = _mark_reached_milestones(goal, reached_date)
+        if newly_reached:
+            results[goal["id"]] = newly_reached
+    return results
+
+
+def _mark_reached_milestones(
+    goal: dict[str, Any],
+    reached_date: datetime | None = None,
+) -> list[dict[str, Any]]:
+    """Mark milestones at or below current_amount as reached; return the newly reached."""
+    milestones = goal.get("milestones", [])
+
+    # Milestones are kept sorted by amount (update_goal), so everything reachable
+    # is a prefix of the list
+    reachable = bisect_right(milestones, goal["current_amount"], key=lambda m: m["amount"])
+    newly_reached = [m for m in milestones[:reachable] if not m.get("reached", False)]
 
     # Save updated milestones
-    if updated:
-        update_goal(goal_id, {"milestones": milestones})
+    if newly_reached:
+        reached_date = reached_date or datetime.utcnow()
+        for milestone_dict in newly_reached:
+            milestone_dict["reached"] = True
+            milestone_dict["reached_date"] = reached_date
+        update_goal(goal["id"], {"milestones": milestones})
 
     return newly_reached
 
 
+_CELEBRATION_TEMPLATES = (
+    " Milestone reached! You've hit ${amount:,.0f} - {description}!",
+    "🎊 Congratulations! ${amount:,.0f} milestone achieved - {description}",
+    "🌟 Great progress! You reached ${amount:,.0f} - {description}",
+    " Keep going! ${amount:,.0f} milestone completed - {description}",
+    " Amazing! You hit ${amount:,.0f} - {description}",
+)
+
+
 def get_celebration_message(milestone: dict[str, Any]) -> str:
     """
     Generate celebration message when milestone is reached.
@@ -187,19 +222,10 @@ def get_celebration_message(milestone: dict[str, Any]) -> str:
         # " Milestone reached! You've hit $25,000 - 25% to target!"
     """
     amount = milestone["amount"]
-    description = milestone["description"]
-
-    messages = [
-        f" Milestone reached! You've hit ${amount:,.0f} - {description}!",
-        f"🎊 Congratulations! ${amount:,.0f} milestone achieved - {description}",
-        f"🌟 Great progress! You reached ${amount:,.0f} - {description}",
-        f" Keep going! ${amount:,.0f} milestone completed - {description}",
-        f" Amazing! You hit ${amount:,.0f} - {description}",
-    ]
 
-    # Use amount to pick consistent message for same milestone
-    index = int(amount) % len(messages)
-    return messages[index]
+    # Use amount to pick consistent message for same milestone; only that one is formatted
+    template = _CELEBRATION_TEMPLATES[int(amount) % len(_CELEBRATION_TEMPLATES)]
+    return template.format(amount=amount, description=milestone["description"])
 
 
 def get_next_milestone(goal_id: str) -> dict[str, Any] | None:
@@ -258,13 +284,18 @@ def get_milestone_progress(goal_id: str) -> dict[str, Any]:
     goal = get_goal(goal_id)
     milestones = goal.get("milestones", [])
 
+    # Count reached milestones and find the next unreached one in a single pass
     total = len(milestones)
-    reached = sum(1 for m in milestones if m.get("reached", False))
+    reached = 0
+    next_milestone = None
+    for milestone in milestones:
+        if milestone.get("reached", False):
+            reached += 1
+        elif next_milestone is None:
+            next_milestone = milestone
     remaining = total - reached
     percent = (reached / total * 100) if total > 0 else 0
 
-    next_milestone = get_next_milestone(goal_id)
-
     return {
         "total_milestones": total,
         "reached_count": reached,
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from datetime import datetime
 from decimal import Decimal
+from functools import lru_cache
 from typing import TYPE_CHECKING, Literal
 
 from .models import Insight, InsightCategory, InsightFeed, InsightPriority
@@ -11,6 +12,14 @@ from .models import Insight, InsightCategory, InsightFeed, InsightPriority
 # Tone type for insight text generation
 InsightTone = Literal["professional", "fun"]
 
+# Feed order, most urgent first
+_PRIORITY_ORDER = (
+    InsightPriority.CRITICAL,
+    InsightPriority.HIGH,
+    InsightPriority.MEDIUM,
+    InsightPriority.LOW,
+)
+
 if TYPE_CHECKING:
     from fin_infra.budgets.models import Budget
     from fin_infra.goals.models import Goal
@@ -54,6 +63,18 @@ def aggregate_insights(
         >>> print(insights.critical_count)
         2
     """
+    # No data yet: skip generation, sorting and counting. The feed is built fresh
+    # each time since callers may mutate it and generated_at must be current.
+    if not (
+        net_worth_snapshots
+        or budgets
+        or goals
+        or recurring_patterns
+        or portfolio_value
+        or tax_opportunities
+    ):
+        return InsightFeed(user_id=user_id, insights=[])
+
     insights: list[Insight] = []
 
     # Net worth insights
@@ -80,18 +101,17 @@ def aggregate_insights(
     if tax_opportunities:
         insights.extend(_generate_tax_insights(user_id, tax_opportunities, tone))
 
-    # Sort by priority: critical > high > medium > low
-    priority_order = {
-        InsightPriority.CRITICAL: 0,
-        InsightPriority.HIGH: 1,
-        InsightPriority.MEDIUM: 2,
-        InsightPriority.LOW: 3,
-    }
-    insights.sort(key=lambda x: (priority_order[x.priority], x.created_at), reverse=False)
+    # Order by priority: critical > high > medium > low. Partition into per-priority
+    # buckets instead of sorting; insights are generated in created_at order, so
+    # appending keeps each bucket ordered by creation time.
+    buckets: dict[InsightPriority, list[Insight]] = {p: [] for p in _PRIORITY_ORDER}
+    for insight in insights:
+        buckets[insight.priority].append(insight)
+    insights = [insight for priority in _PRIORITY_ORDER for insight in buckets[priority]]
 
     # Calculate counts
     unread_count = sum(1 for i in insights if not i.read)
-    critical_count = sum(1 for i in insights if i.priority == InsightPriority.CRITICAL)
+    critical_count = len(buckets[InsightPriority.CRITICAL])
 
     return InsightFeed(
         user_id=user_id,
@@ -119,6 +139,12 @@ def get_user_insights(user_id: str, include_read: bool = False) -> InsightFeed:
     return InsightFeed(user_id=user_id, insights=[])
 
 
+@lru_cache(maxsize=1024)
+def _to_decimal(amount: float) -> Decimal:
+    """Convert a float amount to Decimal via str() (so 0.1 stays 0.1); cached."""
+    return Decimal(str(amount))
+
+
 def _generate_net_worth_insights(
     user_id: str, snapshots: list[NetWorthSnapshot], tone: InsightTone
 ) -> list[Insight]:
@@ -131,11 +157,10 @@ def _generate_net_worth_insights(
     previous = sorted_snapshots[-2]
 
     # Calculate change
-    change = Decimal(str(latest.total_net_worth)) - Decimal(str(previous.total_net_worth))
+    previous_net_worth = _to_decimal(previous.total_net_worth)
+    change = _to_decimal(latest.total_net_worth) - previous_net_worth
     change_pct = (
-        (change / Decimal(str(previous.total_net_worth)) * 100)
-        if previous.total_net_worth != 0
-        else Decimal("0")
+        (change / previous_net_worth * 100) if previous.total_net_worth != 0 else Decimal("0")
     )
 
     if change > 0:
@@ -203,8 +228,8 @@ def _generate_goal_insights(user_id: str, goals: list[Goal], tone: InsightTone)
     insights = []
 
     for goal in goals:
-        current = Decimal(str(goal.current_amount))  # Convert float to Decimal
-        target = Decimal(str(goal.target_amount))
+        current = _to_decimal(goal.current_amount)  # Convert float to Decimal
+        target = _to_decimal(goal.target_amount)
         pct = Decimal((current / target * 100) if target > 0 else "0")
 
         # Goal milestones
@@ -262,28 +287,29 @@ def _generate_recurring_insights(
     """Generate insights from recurring transactions."""
     insights = []
 
-    # High-cost subscriptions (using amount field)
-    high_cost = [
-        p
-        for p in patterns
-        if (p.amount is not None and p.amount > 50) or (p.amount_range and p.amount_range[1] > 50)
-    ]
-    if high_cost:
-        total = Decimal("0")
-        for p in high_cost:
-            if p.amount is not None:
-                total += Decimal(str(p.amount))
-            elif p.amount_range:
-                # Use average of range
-                total += Decimal(str((p.amount_range[0] + p.amount_range[1]) / 2))
-
+    # High-cost subscriptions (using amount field), counted and totaled in one pass
+    high_cost_count = 0
+    total = Decimal("0")
+    for p in patterns:
+        if not (
+            (p.amount is not None and p.amount > 50) or (p.amount_range and p.amount_range[1] > 50)
+        ):
+            continue
+        high_cost_count += 1
+        if p.amount is not None:
+            total += _to_decimal(p.amount)
+        elif p.amount_range:
+            # Use average of range
+            total += _to_decimal((p.amount_range[0] + p.amount_range[1]) / 2)
+
+    if high_cost_count:
         if tone == "fun":
             title = "💸 Subscription Check!"
-            desc = f"{len(high_cost)} subscriptions over $50/mo = ${total:,.2f}. That's some serious recurring vibes"
+            desc = f"{high_cost_count} subscriptions over $50/mo = ${total:,.2f}. That's some serious recurring vibes"
             action = "Time for a subscription audit? 🧐"
         else:
             title = "High-Cost Subscriptions Detected"
-            desc = f"You have {len(high_cost)} subscriptions over $50/month totaling ${total:,.2f}"
+            desc = f"You have {high_cost_count} subscriptions over $50/month totaling ${total:,.2f}"
             action = "Review if all subscriptions are still needed"
         insights.append(
             Insight(
@@ -146,7 +146,7 @@ class SnapTradeInvestmentProvider(InvestmentProvider):
             accounts_url = f"{self.base_url}/accounts"
             response = await self.client.get(accounts_url, headers=auth_headers)
             response.raise_for_status()
-            accounts = await response.json()
+            accounts = response.json()
 
             # Filter accounts if specified
             if account_ids:
@@ -159,7 +159,7 @@ class SnapTradeInvestmentProvider(InvestmentProvider):
                 positions_url = f"{self.base_url}/accounts/{account_id}/positions"
                 pos_response = await self.client.get(positions_url, headers=auth_headers)
                 pos_response.raise_for_status()
-                positions = await pos_response.json()
+                positions = pos_response.json()
 
                 # Transform each position to Holding
                 for position in positions:
@@ -212,7 +212,7 @@ class SnapTradeInvestmentProvider(InvestmentProvider):
             accounts_url = f"{self.base_url}/accounts"
             response = await self.client.get(accounts_url, headers=auth_headers)
             response.raise_for_status()
-            accounts = await response.json()
+            accounts = response.json()
 
             # Filter accounts if specified
             if account_ids:
@@ -232,7 +232,7 @@ class SnapTradeInvestmentProvider(InvestmentProvider):
                     transactions_url, params=tx_params, headers=auth_headers
                 )
                 tx_response.raise_for_status()
-                transactions = await tx_response.json()
+                transactions = tx_response.json()
 
                 # Transform each transaction
                 for transaction in transactions:
@@ -312,7 +312,7 @@ class SnapTradeInvestmentProvider(InvestmentProvider):
             accounts_url = f"{self.base_url}/accounts"
             response = await self.client.get(accounts_url, headers=auth_headers)
             response.raise_for_status()
-            accounts = await response.json()
+            accounts = response.json()
 
             # Fetch holdings for each account
             investment_accounts = []
@@ -323,7 +323,7 @@ class SnapTradeInvestmentProvider(InvestmentProvider):
                 positions_url = f"{self.base_url}/accounts/{account_id}/positions"
                 pos_response = await self.client.get(positions_url, headers=auth_headers)
                 pos_response.raise_for_status()
-                positions = await pos_response.json()
+                positions = pos_response.json()
 
                 # Transform positions to holdings
                 holdings = []
@@ -335,7 +335,7 @@ class SnapTradeInvestmentProvider(InvestmentProvider):
                 balances_url = f"{self.base_url}/accounts/{account_id}/balances"
                 bal_response = await self.client.get(balances_url, headers=auth_headers)
                 bal_response.raise_for_status()
-                balances = await bal_response.json()
+                balances = bal_response.json()
 
                 # Create InvestmentAccount
                 investment_account = InvestmentAccount(
@@ -381,7 +381,7 @@ class SnapTradeInvestmentProvider(InvestmentProvider):
             url = f"{self.base_url}/connections"
             response = await self.client.get(url, headers=auth_headers)
             response.raise_for_status()
-            return cast("list[dict[str, Any]]", await response.json())
+            return cast("list[dict[str, Any]]", response.json())
 
         except httpx.HTTPStatusError as e:
             raise self._transform_error(e)
@@ -518,3 +518,9 @@ def sample_deadline() -> str:
 def today() -> datetime:
     """Return today's date at midnight UTC."""
     return datetime.now(UTC).replace(hour=0, minute=0, second=0, microsecond=0)
+
+
+@pytest.fixture(scope="module")
+def now() -> datetime:
+    """Naive UTC reference time (as goals store it), taken once per test module."""
+    return datetime.utcnow()
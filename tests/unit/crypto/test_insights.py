@@ -1,7 +1,9 @@
 """Unit tests for crypto insights with mocked LLM calls."""
 
+from collections import defaultdict
 from datetime import datetime
 from decimal import Decimal
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
@@ -12,6 +14,25 @@ from fin_infra.crypto.insights import (
     generate_crypto_insights,
 )
 
+# Shared LLM response; tests only read ``.content`` so one instance is safe to reuse.
+_LLM_RESPONSE = SimpleNamespace(
+    content="Your crypto portfolio shows strong Bitcoin allocation. Consider diversifying into Ethereum and stablecoins to reduce volatility risk. Not financial advice - consult a certified advisor."
+)
+
+# Shared Decimal values for the gain/portfolio scenarios
+_PRICE_60K = Decimal("60000")
+_MV_30K = Decimal("30000")
+_TOTAL_100K = Decimal("100000")
+
+
+def _by_category(insights: list[CryptoInsight]) -> dict[str, list[CryptoInsight]]:
+    """Group insights by category in a single pass."""
+    buckets: dict[str, list[CryptoInsight]] = defaultdict(list)
+    for insight in insights:
+        buckets[insight.category].append(insight)
+    return buckets
+
+
 # ---- Fixtures ----
 
 
@@ -56,12 +77,7 @@ def mock_llm():
     """Mock ai-infra LLM."""
     llm = MagicMock()
     llm.model = "gemini-2.0-flash-exp"
-
-    # Mock response
-    mock_response = MagicMock()
-    mock_response.content = "Your crypto portfolio shows strong Bitcoin allocation. Consider diversifying into Ethereum and stablecoins to reduce volatility risk. Not financial advice - consult a certified advisor."
-
-    llm.achat = AsyncMock(return_value=mock_response)
+    llm.achat = AsyncMock(return_value=_LLM_RESPONSE)
     return llm
 
 
@@ -121,16 +137,17 @@ def test_crypto_holding_creation(btc_holding):
 
 
 # ---- Test generate_crypto_insights ----
+# Async tests share one module-scoped event loop; none of them keep loop-bound state.
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="module")
 async def test_generate_insights_empty_holdings():
     """Test with no holdings."""
     insights = await generate_crypto_insights("user_123", [])
     assert insights == []
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="module")
 async def test_generate_insights_high_concentration(btc_holding):
     """Test allocation insight for high concentration."""
     # BTC is 100% of crypto portfolio
@@ -139,7 +156,7 @@ async def test_generate_insights_high_concentration(btc_holding):
     assert len(insights) >= 1
 
     # Find allocation insight
-    alloc_insights = [i for i in insights if i.category == "allocation"]
+    alloc_insights = _by_category(insights)["allocation"]
     assert len(alloc_insights) == 1
 
     insight = alloc_insights[0]
@@ -149,30 +166,30 @@ async def test_generate_insights_high_concentration(btc_holding):
     assert "diversif" in insight.description.lower()
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="module")
 async def test_generate_insights_diversified_portfolio(btc_holding, eth_holding, doge_holding):
     """Test with diversified portfolio (no concentration warnings)."""
     # BTC: 52%, ETH: 46%, DOGE: 2%
     insights = await generate_crypto_insights("user_123", [btc_holding, eth_holding, doge_holding])
 
     # Should have allocation warning for BTC (>50%)
-    alloc_insights = [i for i in insights if i.category == "allocation"]
+    alloc_insights = _by_category(insights)["allocation"]
     assert len(alloc_insights) == 1
     assert alloc_insights[0].symbol == "BTC"
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="module")
 async def test_generate_insights_significant_gains(btc_holding):
     """Test performance insight for significant gains (>25%)."""
     # BTC: cost_basis=40000, current_price=45000 -> +12.5% gain
     # Modify to have >25% gain
-    btc_holding.current_price = Decimal("60000")  # 50% gain
-    btc_holding.market_value = Decimal("30000")
+    btc_holding.current_price = _PRICE_60K  # 50% gain
+    btc_holding.market_value = _MV_30K
 
     insights = await generate_crypto_insights("user_123", [btc_holding])
 
     # Find opportunity insight
-    opp_insights = [i for i in insights if i.category == "opportunity"]
+    opp_insights = _by_category(insights)["opportunity"]
     assert len(opp_insights) == 1
 
     insight = opp_insights[0]
@@ -182,14 +199,14 @@ async def test_generate_insights_significant_gains(btc_holding):
     assert insight.value > 0  # Positive gain
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="module")
 async def test_generate_insights_significant_losses(eth_holding):
     """Test risk insight for significant losses (>25%)."""
     # ETH: cost_basis=3000, current_price=2000 -> -33% loss
     insights = await generate_crypto_insights("user_123", [eth_holding])
 
     # Find risk insight
-    risk_insights = [i for i in insights if i.category == "risk"]
+    risk_insights = _by_category(insights)["risk"]
     assert len(risk_insights) == 1
 
     insight = risk_insights[0]
@@ -199,7 +216,7 @@ async def test_generate_insights_significant_losses(eth_holding):
     assert insight.value < 0  # Negative loss
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="module")
 async def test_generate_insights_with_llm(btc_holding, mock_llm):
     """Test LLM-powered insights (MOCKED - no real LLM call)."""
     insights = await generate_crypto_insights("user_123", [btc_holding], llm=mock_llm)
@@ -227,22 +244,20 @@ async def test_generate_insights_with_llm(btc_holding, mock_llm):
     assert "$22,500" in user_msg
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="module")
 async def test_generate_insights_with_total_portfolio_value(btc_holding, eth_holding):
     """Test insights with total portfolio value context."""
-    total_portfolio = Decimal("100000")  # Crypto is 42.5%
-
     insights = await generate_crypto_insights(
         "user_123",
         [btc_holding, eth_holding],
-        total_portfolio_value=total_portfolio,
+        total_portfolio_value=_TOTAL_100K,  # Crypto is 42.5%
     )
 
     # Should generate insights based on crypto allocation % of total portfolio
     assert len(insights) >= 1
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="module")
 async def test_generate_insights_llm_failure_graceful(btc_holding):
     """Test graceful degradation when LLM fails."""
     # Mock LLM that raises exception
@@ -261,22 +276,22 @@ async def test_generate_insights_llm_failure_graceful(btc_holding):
     assert len(llm_insights) == 0
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="module")
 async def test_generate_insights_multiple_holdings_all_categories(btc_holding, eth_holding):
     """Test comprehensive insights across all categories."""
     # Modify holdings for diverse insights
-    btc_holding.current_price = Decimal("60000")  # Large gain
-    btc_holding.market_value = Decimal("30000")
+    btc_holding.current_price = _PRICE_60K  # Large gain
+    btc_holding.market_value = _MV_30K
 
     insights = await generate_crypto_insights("user_123", [btc_holding, eth_holding])
 
     # Should have multiple insight types
-    categories = {i.category for i in insights}
-    assert "allocation" in categories
-    assert "opportunity" in categories or "risk" in categories
+    buckets = _by_category(insights)
+    assert buckets["allocation"]
+    assert buckets["opportunity"] or buckets["risk"]
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="module")
 async def test_insight_ids_unique(btc_holding, eth_holding):
     """Test that insight IDs are unique."""
     insights = await generate_crypto_insights("user_123", [btc_holding, eth_holding])
@@ -285,7 +300,7 @@ async def test_insight_ids_unique(btc_holding, eth_holding):
     assert len(ids) == len(set(ids))  # All unique
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="module")
 async def test_insight_timestamps(btc_holding):
     """Test that insights have valid timestamps."""
     before = datetime.now()
@@ -296,14 +311,14 @@ async def test_insight_timestamps(btc_holding):
         assert before <= insight.created_at <= after
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="module")
 async def test_llm_prompt_includes_holdings_summary(btc_holding, eth_holding, mock_llm):
     """Test that LLM prompt includes detailed holdings summary."""
     await generate_crypto_insights(
         "user_123",
         [btc_holding, eth_holding],
         llm=mock_llm,
-        total_portfolio_value=Decimal("100000"),
+        total_portfolio_value=_TOTAL_100K,
     )
 
     call_args = mock_llm.achat.call_args
@@ -317,7 +332,7 @@ async def test_llm_prompt_includes_holdings_summary(btc_holding, eth_holding, mo
     assert "gain/loss" in prompt.lower()
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="module")
 async def test_no_llm_insights_when_llm_not_provided(btc_holding):
     """Test that no LLM insights generated when llm=None."""
     insights = await generate_crypto_insights("user_123", [btc_holding], llm=None)
@@ -1,5 +1,7 @@
 """Unit tests for financial document storage operations."""
 
+import asyncio
+
 import pytest
 from svc_infra.storage.backends.memory import MemoryBackend
 
@@ -11,6 +13,7 @@ from fin_infra.documents.storage import (
     get_document,
     list_documents,
     upload_document,
+    upload_documents,
 )
 
 
@@ -68,6 +71,43 @@ class TestUploadDocument:
         assert doc.metadata["document_type"] == "receipt"
         assert doc.content_type == "image/jpeg"
 
+    async def test_upload_does_not_mutate_caller_metadata(self, storage):
+        """Test that financial fields are merged into a copy of the caller's metadata."""
+        metadata = {"employer": "ACME Corp"}
+        doc = await upload_document(
+            storage=storage,
+            user_id="user_123",
+            file=b"content",
+            document_type=DocumentType.TAX,
+            filename="w2.pdf",
+            metadata=metadata,
+            tax_year=2024,
+        )
+
+        assert metadata == {"employer": "ACME Corp"}
+        assert doc.metadata["employer"] == "ACME Corp"
+        assert doc.metadata["tax_year"] == 2024
+
+    async def test_upload_content_type_from_extension(self, storage):
+        """Test content type detection is case-insensitive and falls back for unknown types."""
+        scan = await upload_document(
+            storage=storage,
+            user_id="user_123",
+            file=b"content",
+            document_type=DocumentType.RECEIPT,
+            filename="SCAN.PNG",
+        )
+        unknown = await upload_document(
+            storage=storage,
+            user_id="user_123",
+            file=b"content",
+            document_type=DocumentType.OTHER,
+            filename="export",
+        )
+
+        assert scan.content_type == "image/png"
+        assert unknown.content_type == "application/octet-stream"
+
     async def test_upload_generates_unique_ids(self, storage):
         """Test that each upload generates a unique ID."""
         doc1 = await upload_document(
@@ -102,6 +142,60 @@ class TestUploadDocument:
         assert doc.checksum.startswith("sha256:")  # SHA-256 with prefix
 
 
+@pytest.mark.asyncio
+class TestUploadDocuments:
+    """Tests for upload_documents batch function."""
+
+    async def test_upload_batch_preserves_order(self, storage):
+        """Test batch upload returns documents in input order with financial fields."""
+        docs = await upload_documents(
+            storage=storage,
+            user_id="user_123",
+            files=[
+                (b"w2", DocumentType.TAX, "w2.pdf", {"tax_year": 2024, "form_type": "W-2"}),
+                (b"receipt", DocumentType.RECEIPT, "receipt.jpg", None),
+            ],
+        )
+
+        assert [d.filename for d in docs] == ["w2.pdf", "receipt.jpg"]
+        assert docs[0].tax_year == 2024
+        assert docs[0].form_type == "W-2"
+        assert docs[1].type == DocumentType.RECEIPT
+        assert len({d.id for d in docs}) == 2
+        assert len(list_documents(user_id="user_123")) == 2
+
+    async def test_upload_batch_empty(self, storage):
+        """Test batch upload with no files."""
+        assert await upload_documents(storage=storage, user_id="user_123", files=[]) == []
+
+    async def test_upload_batch_failure_cancels_pending_uploads(self, storage, monkeypatch):
+        """Test a failed upload cancels the uploads still running before raising."""
+        cancelled = []
+
+        async def fake_upload(*, filename, **kwargs):
+            if filename == "bad.pdf":
+                raise RuntimeError("upload failed")
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.append(filename)
+                raise
+
+        monkeypatch.setattr("fin_infra.documents.storage.base_upload_document", fake_upload)
+
+        with pytest.raises(RuntimeError, match="upload failed"):
+            await upload_documents(
+                storage=storage,
+                user_id="user_123",
+                files=[
+                    (b"slow", DocumentType.TAX, "slow.pdf", None),
+                    (b"bad", DocumentType.TAX, "bad.pdf", None),
+                ],
+            )
+
+        assert cancelled == ["slow.pdf"]
+
+
 @pytest.mark.asyncio
 class TestGetDocument:
     """Tests for get_document function."""
@@ -126,6 +220,24 @@ class TestGetDocument:
         result = get_document("doc_nonexistent")
         assert result is None
 
+    @pytest.mark.parametrize("raw_type", [["tax"], {"type": "tax"}, 7, "not_a_type"])
+    async def test_get_document_with_malformed_type_falls_back_to_other(self, storage, raw_type):
+        """Test a document_type that is not a known string (even unhashable) maps to OTHER."""
+        from svc_infra.documents import upload_document as base_upload_document
+
+        base_doc = await base_upload_document(
+            storage=storage,
+            user_id="user_123",
+            file=b"content",
+            filename="test.pdf",
+            metadata={"document_type": raw_type},
+        )
+
+        retrieved = get_document(base_doc.id)
+        assert retrieved is not None
+        assert retrieved.type == DocumentType.OTHER
+        assert [d.id for d in list_documents(user_id="user_123")] == [base_doc.id]
+
 
 @pytest.mark.asyncio
 class TestDownloadDocument:
@@ -184,39 +296,36 @@ class TestDeleteDocument:
 class TestListDocuments:
     """Tests for list_documents function."""
 
-    async def test_list_all_user_documents(self, storage):
-        """Test listing all documents for a user."""
+    async def test_list_documents_sorted_by_date(self, storage):
+        """Test that documents are sorted by upload date descending."""
         doc1 = await upload_document(
             storage=storage,
             user_id="user_123",
             file=b"content1",
             document_type=DocumentType.TAX,
-            filename="tax.pdf",
+            filename="first.pdf",
         )
         doc2 = await upload_document(
             storage=storage,
             user_id="user_123",
             file=b"content2",
-            document_type=DocumentType.RECEIPT,
-            filename="receipt.pdf",
-        )
-        # Different user
-        await upload_document(
-            storage=storage,
-            user_id="user_456",
-            file=b"content3",
             document_type=DocumentType.TAX,
-            filename="other.pdf",
+            filename="second.pdf",
         )
 
         docs = list_documents(user_id="user_123")
-        assert len(docs) == 2
-        assert doc1.id in [d.id for d in docs]
-        assert doc2.id in [d.id for d in docs]
+        # Most recent first
+        assert docs[0].id == doc2.id
+        assert docs[1].id == doc1.id
 
-    async def test_list_documents_by_type(self, storage):
-        """Test filtering documents by type."""
-        doc1 = await upload_document(
+    async def test_list_documents_empty(self, storage):
+        """Test listing documents for user with no documents."""
+        docs = list_documents(user_id="user_empty")
+        assert docs == []
+
+    async def test_list_documents_paginates_after_filtering(self, storage):
+        """Test that limit/offset apply to filtered results, not the raw listing."""
+        tax_doc = await upload_document(
             storage=storage,
             user_id="user_123",
             file=b"content1",
@@ -231,87 +340,60 @@ class TestListDocuments:
             filename="receipt.pdf",
         )
 
-        docs = list_documents(user_id="user_123", document_type=DocumentType.TAX)
-        assert len(docs) == 1
-        assert docs[0].id == doc1.id
+        # Newest document is the receipt; the tax document must still be found
+        docs = list_documents(user_id="user_123", document_type=DocumentType.TAX, limit=1)
+        assert [d.id for d in docs] == [tax_doc.id]
 
-    async def test_list_documents_by_year(self, storage):
-        """Test filtering documents by year."""
-        doc1 = await upload_document(
-            storage=storage,
-            user_id="user_123",
-            file=b"content1",
-            document_type=DocumentType.TAX,
-            filename="tax_2024.pdf",
-            tax_year=2024,
-        )
-        await upload_document(
-            storage=storage,
-            user_id="user_123",
-            file=b"content2",
-            document_type=DocumentType.TAX,
-            filename="tax_2023.pdf",
-            tax_year=2023,
-        )
+        assert list_documents(user_id="user_123", document_type=DocumentType.TAX, offset=1) == []
 
-        docs = list_documents(user_id="user_123", tax_year=2024)
-        assert len(docs) == 1
-        assert docs[0].id == doc1.id
 
-    async def test_list_documents_by_type_and_year(self, storage):
-        """Test filtering by both type and year."""
-        doc1 = await upload_document(
-            storage=storage,
-            user_id="user_123",
-            file=b"content1",
-            document_type=DocumentType.TAX,
-            filename="tax_2024.pdf",
-            tax_year=2024,
-        )
-        await upload_document(
-            storage=storage,
-            user_id="user_123",
-            file=b"content2",
-            document_type=DocumentType.TAX,
-            filename="tax_2023.pdf",
-            tax_year=2023,
-        )
-        await upload_document(
-            storage=storage,
-            user_id="user_123",
-            file=b"content3",
-            document_type=DocumentType.RECEIPT,
-            filename="receipt_2024.pdf",
-            tax_year=2024,
-        )
-
-        docs = list_documents(user_id="user_123", document_type=DocumentType.TAX, tax_year=2024)
-        assert len(docs) == 1
-        assert docs[0].id == doc1.id
-
-    async def test_list_documents_sorted_by_date(self, storage):
-        """Test that documents are sorted by upload date descending."""
-        doc1 = await upload_document(
+@pytest.fixture(scope="class")
+def listed_document_ids():
+    """Upload the canonical document set once for TestListDocumentFilters."""
+    storage = MemoryBackend()
+    clear_storage()
+    docs = asyncio.run(
+        upload_documents(
             storage=storage,
             user_id="user_123",
-            file=b"content1",
-            document_type=DocumentType.TAX,
-            filename="first.pdf",
+            files=[
+                (b"content1", DocumentType.TAX, "tax_2024.pdf", {"tax_year": 2024}),
+                (b"content2", DocumentType.TAX, "tax_2023.pdf", {"tax_year": 2023}),
+                (b"content3", DocumentType.RECEIPT, "receipt_2024.pdf", {"tax_year": 2024}),
+            ],
         )
-        doc2 = await upload_document(
+    )
+    # Different user
+    asyncio.run(
+        upload_documents(
             storage=storage,
-            user_id="user_123",
-            file=b"content2",
-            document_type=DocumentType.TAX,
-            filename="second.pdf",
+            user_id="user_456",
+            files=[(b"content4", DocumentType.TAX, "other.pdf", {"tax_year": 2024})],
         )
+    )
+    yield {doc.filename: doc.id for doc in docs}
+    clear_storage()
 
-        docs = list_documents(user_id="user_123")
-        # Most recent first
-        assert docs[0].id == doc2.id
-        assert docs[1].id == doc1.id
 
-    async def test_list_documents_empty(self, storage):
-        """Test listing documents for user with no documents."""
-        docs = list_documents(user_id="user_empty")
-        assert docs == []
+class TestListDocumentFilters:
+    """Tests for list_documents filters over one shared set of documents."""
+
+    @pytest.fixture(autouse=True)
+    def clear_metadata(self):
+        """Keep the class-scoped documents between tests (overrides the module fixture)."""
+        yield
+
+    @pytest.mark.parametrize(
+        ("filters", "expected"),
+        [
+            ({}, {"tax_2024.pdf", "tax_2023.pdf", "receipt_2024.pdf"}),
+            ({"document_type": DocumentType.TAX}, {"tax_2024.pdf", "tax_2023.pdf"}),
+            ({"tax_year": 2024}, {"tax_2024.pdf", "receipt_2024.pdf"}),
+            ({"document_type": DocumentType.TAX, "tax_year": 2024}, {"tax_2024.pdf"}),
+        ],
+        ids=["all", "by_type", "by_year", "by_type_and_year"],
+    )
+    def test_list_documents_filters(self, listed_document_ids, filters, expected):
+        """Test listing a user's documents with type and year filters."""
+        docs = list_documents(user_id="user_123", **filters)
+        assert {d.id for d in docs} == {listed_document_ids[name] for name in expected}
@@ -1,7 +1,11 @@
 """Unit tests for goals funding allocation."""
 
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
 import pytest
 
+from fin_infra.goals import funding
 from fin_infra.goals.funding import (
     clear_funding_store,
     get_account_allocations,
@@ -106,12 +110,37 @@ def test_link_account_to_goal_negative_allocation(sample_goal):
         link_account_to_goal(sample_goal["id"], "checking", -10.0)
 
 
+def test_link_account_to_goal_allocation_rounding_to_zero(sample_goal):
+    """Test an allocation below 0.005% is rejected instead of stored as 0 bp."""
+    with pytest.raises(ValueError, match="must be positive"):
+        link_account_to_goal(sample_goal["id"], "checking", 0.004)
+
+    assert get_account_allocations("checking") == {}
+
+
 def test_link_account_to_goal_over_100_allocation(sample_goal):
     """Test linking with >100% allocation raises ValueError."""
     with pytest.raises(ValueError, match="cannot exceed 100%"):
         link_account_to_goal(sample_goal["id"], "checking", 150.0)
 
 
+@pytest.mark.parametrize(
+    ("allocation", "message"),
+    [
+        (float("inf"), "cannot exceed 100%"),
+        (1e307, "cannot exceed 100%"),
+        (float("-inf"), "must be positive"),
+        (float("nan"), "must be a number"),
+    ],
+)
+def test_link_account_to_goal_non_finite_allocation(sample_goal, allocation, message):
+    """Test infinite, overflowing, and NaN allocations raise ValueError, not OverflowError."""
+    with pytest.raises(ValueError, match=message):
+        link_account_to_goal(sample_goal["id"], "checking", allocation)
+
+    assert get_account_allocations("checking") == {}
+
+
 def test_link_account_to_goal_exceeds_total_allocation(sample_goal):
     """Test linking when total allocation would exceed 100%."""
     goal2 = create_goal(
@@ -155,6 +184,29 @@ def test_link_account_to_goal_exactly_100_allocation(sample_goal):
     assert sum(allocations.values()) == 100.0
 
 
+def test_link_account_to_goal_exactly_100_with_fractional_allocations(sample_goal):
+    """Test fractional allocations summing to 100% are not rejected by float drift."""
+    goal2 = create_goal(
+        user_id="user_123", name="Vacation", goal_type="savings", target_amount=5000.0
+    )
+    goal3 = create_goal(user_id="user_123", name="Car", goal_type="savings", target_amount=20000.0)
+
+    # 0.2 + 83.9 + 15.9 sums to 100.00000000000001 in floating point
+    link_account_to_goal(sample_goal["id"], "checking", 0.2)
+    link_account_to_goal(goal2["id"], "checking", 83.9)
+    link_account_to_goal(goal3["id"], "checking", 15.9)
+
+    assert len(get_account_allocations("checking")) == 3
+
+
+def test_link_account_to_goal_rounds_to_basis_points(sample_goal):
+    """Test allocations are stored to 0.01% precision."""
+    source = link_account_to_goal(sample_goal["id"], "checking", 33.333)
+
+    assert source.allocation_percent == 33.33
+    assert get_account_allocations("checking") == {sample_goal["id"]: 33.33}
+
+
 def test_link_account_to_goal_update_existing(sample_goal):
     """Test linking account to goal updates existing allocation."""
     # First allocation
@@ -302,6 +354,16 @@ def test_update_account_allocation_zero(sample_goal):
         update_account_allocation(sample_goal["id"], "checking", 0.0)
 
 
+def test_update_account_allocation_rounding_to_zero(sample_goal):
+    """Test updating to an allocation below 0.005% raises ValueError."""
+    link_account_to_goal(sample_goal["id"], "checking", 50.0)
+
+    with pytest.raises(ValueError, match="must be positive"):
+        update_account_allocation(sample_goal["id"], "checking", 0.004)
+
+    assert get_account_allocations("checking") == {sample_goal["id"]: 50.0}
+
+
 def test_update_account_allocation_over_100(sample_goal):
     """Test updating allocation to >100% raises ValueError."""
     link_account_to_goal(sample_goal["id"], "checking", 50.0)
@@ -310,6 +372,18 @@ def test_update_account_allocation_over_100(sample_goal):
         update_account_allocation(sample_goal["id"], "checking", 150.0)
 
 
+def test_update_account_allocation_non_finite(sample_goal):
+    """Test updating allocation to inf or NaN raises ValueError and keeps the old one."""
+    link_account_to_goal(sample_goal["id"], "checking", 50.0)
+
+    with pytest.raises(ValueError, match="cannot exceed 100%"):
+        update_account_allocation(sample_goal["id"], "checking", float("inf"))
+    with pytest.raises(ValueError, match="must be a number"):
+        update_account_allocation(sample_goal["id"], "checking", float("nan"))
+
+    assert get_account_allocations("checking") == {sample_goal["id"]: 50.0}
+
+
 # ============================================================================
 # remove_account_from_goal tests
 # ============================================================================
@@ -467,3 +541,48 @@ def test_complex_multi_account_multi_goal_scenario():
     assert len(get_goal_funding_sources(goals[1]["id"])) == 1  # checking only
     assert len(get_goal_funding_sources(goals[2]["id"])) == 2  # checking + savings
     assert len(get_goal_funding_sources(goals[3]["id"])) == 2  # savings + investment
+
+
+def test_concurrent_links_never_exceed_100_percent(monkeypatch):
+    """Test two links racing past the 100% check cannot both be written.
+
+    The patched check waits on a barrier after validating, so without
+    _FUNDING_LOCK both threads would pass the check before either writes.
+    With the lock the second thread cannot reach the check, the first
+    thread's wait times out, and the second thread then sees the first
+    allocation.
+    """
+    goals = [
+        create_goal(
+            user_id="user_123",
+            name=f"Goal {i}",
+            goal_type="savings",
+            target_amount=1000.0,
+        )
+        for i in range(2)
+    ]
+    barrier = threading.Barrier(2, timeout=0.2)
+    check_account_total = funding._check_account_total
+
+    def check_then_wait(*args):
+        new_total_bp = check_account_total(*args)
+        try:
+            barrier.wait()
+        except threading.BrokenBarrierError:
+            pass
+        return new_total_bp
+
+    monkeypatch.setattr(funding, "_check_account_total", check_then_wait)
+
+    def link(goal_id: str) -> bool:
+        try:
+            link_account_to_goal(goal_id, "checking", 60.0)
+        except ValueError:
+            return False
+        return True
+
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        results = list(pool.map(link, [g["id"] for g in goals]))
+
+    assert sum(results) == 1
+    assert sum(get_account_allocations("checking").values()) == 60.0
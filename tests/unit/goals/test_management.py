@@ -13,16 +13,19 @@ Tests cover:
 from datetime import datetime, timedelta
 
 import pytest
+from pydantic import ValidationError
 
 from fin_infra.goals import (
     create_goal,
+    create_goals,
     delete_goal,
     get_goal,
     get_goal_progress,
+    iter_goals,
     list_goals,
     update_goal,
 )
-from fin_infra.goals.management import _GOALS_STORE
+from fin_infra.goals.management import _GOALS_STORE, clear_goals_store
 
 # ============================================================================
 # Test Fixtures
@@ -30,17 +33,17 @@ from fin_infra.goals.management import _GOALS_STORE
 
 
 @pytest.fixture(autouse=True)
-def clear_goals_store():
+def reset_goals_store():
     """Clear the in-memory goals store before each test."""
-    _GOALS_STORE.clear()
+    clear_goals_store()
     yield
-    _GOALS_STORE.clear()
+    clear_goals_store()
 
 
 @pytest.fixture
-def sample_deadline():
+def sample_deadline(now):
     """Sample deadline 2 years from now."""
-    return datetime.utcnow() + timedelta(days=730)
+    return now + timedelta(days=730)
 
 
 # ============================================================================
@@ -93,7 +96,24 @@ def test_create_goal_with_all_fields(sample_deadline):
     assert goal["tags"] == ["essential", "housing"]
 
 
-def test_create_goal_validates_target_amount():
+def test_create_goal_generates_unique_ids(sample_deadline):
+    """Test that goals created back-to-back get distinct IDs."""
+    ids = {
+        create_goal(
+            user_id="user_123",
+            name=f"Goal {i}",
+            goal_type="savings",
+            target_amount=1000.0,
+            deadline=sample_deadline,
+        )["id"]
+        for i in range(20)
+    }
+
+    assert len(ids) == 20
+    assert len(list_goals(user_id="user_123")) == 20
+
+
+def test_create_goal_validates_target_amount(now):
     """Test that create_goal validates target_amount > 0."""
     with pytest.raises(ValueError, match="greater than 0"):
         create_goal(
@@ -101,11 +121,11 @@ def test_create_goal_validates_target_amount():
             name="Invalid Goal",
             goal_type="savings",
             target_amount=0.0,  # Invalid
-            deadline=datetime.utcnow() + timedelta(days=365),
+            deadline=now + timedelta(days=365),
         )
 
 
-def test_create_goal_validates_current_amount():
+def test_create_goal_validates_current_amount(now):
     """Test that create_goal validates current_amount >= 0."""
     with pytest.raises(ValueError, match="greater than or equal to 0"):
         create_goal(
@@ -113,12 +133,12 @@ def test_create_goal_validates_current_amount():
             name="Invalid Goal",
             goal_type="savings",
             target_amount=10000.0,
-            deadline=datetime.utcnow() + timedelta(days=365),
+            deadline=now + timedelta(days=365),
             current_amount=-100.0,  # Invalid
         )
 
 
-def test_create_goal_validates_current_vs_target():
+def test_create_goal_validates_current_vs_target(now):
     """Test that create_goal validates current_amount <= target_amount."""
     with pytest.raises(ValueError, match="cannot exceed target_amount"):
         create_goal(
@@ -126,25 +146,121 @@ def test_create_goal_validates_current_vs_target():
             name="Invalid Goal",
             goal_type="savings",
             target_amount=10000.0,
-            deadline=datetime.utcnow() + timedelta(days=365),
+            deadline=now + timedelta(days=365),
             current_amount=15000.0,  # Invalid: exceeds target
         )
 
 
-def test_create_goal_stores_in_memory():
+def test_create_goal_validates_user_id_type(now):
+    """Test that a non-str user_id fails Goal validation, not string interning."""
+    with pytest.raises(ValidationError, match="user_id"):
+        create_goal(
+            user_id=123,
+            name="Invalid Goal",
+            goal_type="savings",
+            target_amount=10000.0,
+            deadline=now + timedelta(days=365),
+        )
+
+    assert _GOALS_STORE == {}
+
+
+def test_create_goal_stores_in_memory(now):
     """Test that create_goal stores goal in _GOALS_STORE."""
     goal = create_goal(
         user_id="user_123",
         name="Emergency Fund",
         goal_type="savings",
         target_amount=10000.0,
-        deadline=datetime.utcnow() + timedelta(days=365),
+        deadline=now + timedelta(days=365),
     )
 
     assert goal["id"] in _GOALS_STORE
     assert _GOALS_STORE[goal["id"]] == goal
 
 
+def test_create_goals_creates_batch_in_order(sample_deadline):
+    """Test create_goals creates every goal for the user in input order."""
+    goals = create_goals(
+        user_id="user_123",
+        goals=[
+            {"name": "Emergency Fund", "goal_type": "savings", "target_amount": 10000.0},
+            {
+                "name": "Pay Off Loan",
+                "goal_type": "debt",
+                "target_amount": 5000.0,
+                "current_amount": 8000.0,
+                "deadline": sample_deadline,
+            },
+        ],
+    )
+
+    assert [g["name"] for g in goals] == ["Emergency Fund", "Pay Off Loan"]
+    assert [g["id"] for g in list_goals(user_id="user_123")] == [g["id"] for g in goals]
+
+
+def test_create_goals_rejects_invalid_amounts_up_front():
+    """Test create_goals reports every invalid index and stores nothing."""
+    with pytest.raises(ValueError, match=r"indices \[1, 2\]"):
+        create_goals(
+            user_id="user_123",
+            goals=[
+                {"name": "Valid", "goal_type": "savings", "target_amount": 10000.0},
+                {"name": "Zero Target", "goal_type": "savings", "target_amount": 0.0},
+                {
+                    "name": "Over Target",
+                    "goal_type": "savings",
+                    "target_amount": 100.0,
+                    "current_amount": 200.0,
+                },
+            ],
+        )
+
+    assert list_goals(user_id="user_123") == []
+
+
+def test_create_goals_rejects_missing_fields():
+    """Test a spec without target_amount raises ValueError naming its index."""
+    with pytest.raises(ValueError, match=r"indices \[1\] are missing"):
+        create_goals(
+            user_id="user_123",
+            goals=[
+                {"name": "Valid", "goal_type": "savings", "target_amount": 10000.0},
+                {"name": "No Target", "goal_type": "savings"},
+            ],
+        )
+
+    assert list_goals(user_id="user_123") == []
+
+
+def test_create_goals_rejects_non_numeric_amounts():
+    """Test a None amount raises ValueError naming its index."""
+    with pytest.raises(ValueError, match=r"Non-numeric .* indices \[0\]"):
+        create_goals(
+            user_id="user_123",
+            goals=[
+                {"name": "No Amount", "goal_type": "savings", "target_amount": None},
+                {"name": "Valid", "goal_type": "savings", "target_amount": 10000.0},
+            ],
+        )
+
+    assert list_goals(user_id="user_123") == []
+
+
+def test_create_goals_rolls_back_on_failure():
+    """Test create_goals removes already-created goals when a later goal fails."""
+    with pytest.raises(ValueError):
+        create_goals(
+            user_id="user_123",
+            goals=[
+                {"name": "Valid", "goal_type": "savings", "target_amount": 10000.0},
+                {"name": "Bad Type", "goal_type": "lottery", "target_amount": 10000.0},
+            ],
+        )
+
+    assert list_goals(user_id="user_123") == []
+
+
 # ============================================================================
 # list_goals Tests
 # ============================================================================
@@ -165,7 +281,7 @@ def test_list_goals_filters_by_user_id(sample_deadline):
         target_amount=10000.0,
         deadline=sample_deadline,
     )
-    goal2 = create_goal(
+    create_goal(
         user_id="user_456",
         name="Goal 2",
         goal_type="savings",
@@ -181,10 +297,85 @@ def test_list_goals_filters_by_user_id(sample_deadline):
     )
 
     goals = list_goals(user_id="user_123")
-    assert len(goals) == 2
-    assert goal1 in goals
-    assert goal3 in goals
-    assert goal2 not in goals
+    assert {g["id"] for g in goals} == {goal1["id"], goal3["id"]}
+
+
+def test_list_goals_excludes_deleted_goals(sample_deadline):
+    """Test list_goals no longer returns a goal after it is deleted."""
+    goal1 = create_goal(
+        user_id="user_123",
+        name="Goal 1",
+        goal_type="savings",
+        target_amount=10000.0,
+        deadline=sample_deadline,
+    )
+    goal2 = create_goal(
+        user_id="user_123",
+        name="Goal 2",
+        goal_type="savings",
+        target_amount=20000.0,
+        deadline=sample_deadline,
+    )
+
+    delete_goal(goal1["id"])
+    assert [g["id"] for g in list_goals(user_id="user_123")] == [goal2["id"]]
+
+    delete_goal(goal2["id"])
+    assert list_goals(user_id="user_123") == []
+
+
+def test_iter_goals_yields_lazily(sample_deadline):
+    """Test iter_goals yields the same goals as list_goals, one at a time."""
+    goal1 = create_goal(
+        user_id="user_123",
+        name="Goal 1",
+        goal_type="savings",
+        target_amount=10000.0,
+        deadline=sample_deadline,
+    )
+    create_goal(
+        user_id="user_123",
+        name="Goal 2",
+        goal_type="debt",
+        target_amount=20000.0,
+        deadline=sample_deadline,
+    )
+
+    goals = iter_goals(user_id="user_123")
+    assert next(goals)["id"] == goal1["id"]
+    assert list(iter_goals(user_id="user_123", goal_type="debt")) == list_goals(
+        user_id="user_123", goal_type="debt"
+    )
+
+
+def test_iter_goals_allows_updates_and_deletes_while_iterating(sample_deadline):
+    """Test goals can be paused or deleted inside an iter_goals loop."""
+    goals = [
+        create_goal(
+            user_id="user_123",
+            name=f"Goal {i}",
+            goal_type="savings",
+            target_amount=10000.0,
+            deadline=sample_deadline,
+        )
+        for i in range(3)
+    ]
+
+    paused = []
+    for goal in iter_goals(user_id="user_123", goal_type="savings", status="active"):
+        update_goal(goal["id"], updates={"status": "paused"})
+        paused.append(goal["id"])
+
+    assert paused == [g["id"] for g in goals]
+
+    # A goal deleted before the loop reaches it is skipped
+    visited = []
+    for goal in iter_goals(user_id="user_123", status="paused"):
+        if not visited:
+            delete_goal(goals[2]["id"])
+        visited.append(goal["id"])
+
+    assert visited == [goals[0]["id"], goals[1]["id"]]
 
 
 def test_list_goals_filters_by_type(sample_deadline):
@@ -196,7 +387,7 @@ def test_list_goals_filters_by_type(sample_deadline):
         target_amount=10000.0,
         deadline=sample_deadline,
     )
-    goal2 = create_goal(
+    create_goal(
         user_id="user_123",
         name="Pay Off Credit Card",
         goal_type="debt",
@@ -205,9 +396,7 @@ def test_list_goals_filters_by_type(sample_deadline):
     )
 
     goals = list_goals(user_id="user_123", goal_type="savings")
-    assert len(goals) == 1
-    assert goal1 in goals
-    assert goal2 not in goals
+    assert [g["id"] for g in goals] == [goal1["id"]]
 
 
 def test_list_goals_filters_by_status(sample_deadline):
@@ -269,6 +458,51 @@ def test_list_goals_filters_by_multiple_criteria(sample_deadline):
     assert goals[0]["id"] == goal1["id"]
 
 
+def test_list_goals_multiple_criteria_tracks_status_changes(sample_deadline):
+    """Test list_goals by type and status reflects updates and deletions."""
+    goal = create_goal(
+        user_id="user_123",
+        name="Emergency Fund",
+        goal_type="savings",
+        target_amount=10000.0,
+        deadline=sample_deadline,
+    )
+
+    update_goal(goal["id"], updates={"status": "paused"})
+    assert list_goals(user_id="user_123", goal_type="savings", status="active") == []
+    paused = list_goals(user_id="user_123", goal_type="savings", status="paused")
+    assert [g["id"] for g in paused] == [goal["id"]]
+
+    delete_goal(goal["id"])
+    assert list_goals(user_id="user_123", goal_type="savings", status="paused") == []
+
+
+def test_list_goals_multiple_criteria_keeps_creation_order(sample_deadline):
+    """Test list_goals by type and status keeps creation order after a pause/reactivate."""
+    goal_a = create_goal(
+        user_id="user_123",
+        name="Emergency Fund",
+        goal_type="savings",
+        target_amount=10000.0,
+        deadline=sample_deadline,
+    )
+    goal_b = create_goal(
+        user_id="user_123",
+        name="Vacation Fund",
+        goal_type="savings",
+        target_amount=5000.0,
+        deadline=sample_deadline,
+    )
+
+    update_goal(goal_a["id"], updates={"status": "paused"})
+    update_goal(goal_a["id"], updates={"status": "active"})
+
+    expected = [goal_a["id"], goal_b["id"]]
+    goals = list_goals(user_id="user_123", goal_type="savings", status="active")
+    assert [g["id"] for g in goals] == expected
+    assert [g["id"] for g in list_goals(user_id="user_123", goal_type="savings")] == expected
+
+
 # ============================================================================
 # get_goal Tests
 # ============================================================================
@@ -314,7 +548,7 @@ def test_update_goal_single_field(sample_deadline):
     assert updated["target_amount"] == 10000.0  # Unchanged
 
 
-def test_update_goal_multiple_fields(sample_deadline):
+def test_update_goal_multiple_fields(sample_deadline, now):
     """Test update_goal updates multiple fields."""
     goal = create_goal(
         user_id="user_123",
@@ -324,7 +558,7 @@ def test_update_goal_multiple_fields(sample_deadline):
         deadline=sample_deadline,
     )
 
-    new_deadline = datetime.utcnow() + timedelta(days=1095)
+    new_deadline = now + timedelta(days=1095)
     updated = update_goal(
         goal["id"],
         updates={
@@ -370,12 +604,9 @@ def test_update_goal_updates_timestamp(sample_deadline):
         deadline=sample_deadline,
     )
 
-    original_updated_at = goal["updated_at"]
-
-    # Wait a moment to ensure timestamp changes
-    import time
-
-    time.sleep(0.01)
+    # Backdate the stored timestamp so the update is observable without sleeping
+    original_updated_at = goal["updated_at"] - timedelta(seconds=1)
+    _GOALS_STORE[goal["id"]]["updated_at"] = original_updated_at
 
     updated = update_goal(goal["id"], updates={"name": "New Name"})
     assert updated["updated_at"] > original_updated_at
@@ -434,9 +665,9 @@ def test_get_goal_progress_on_track(sample_deadline):
     assert isinstance(progress["on_track"], bool)
 
 
-def test_get_goal_progress_zero_progress():
+def test_get_goal_progress_zero_progress(now):
     """Test get_goal_progress handles zero current_amount."""
-    deadline = datetime.utcnow() + timedelta(days=365)
+    deadline = now + timedelta(days=365)
     goal = create_goal(
         user_id="user_123",
         name="New Goal",
@@ -452,9 +683,9 @@ def test_get_goal_progress_zero_progress():
     assert progress["monthly_contribution_target"] > 0
 
 
-def test_get_goal_progress_complete():
+def test_get_goal_progress_complete(now):
     """Test get_goal_progress handles 100% complete goal."""
-    deadline = datetime.utcnow() + timedelta(days=365)
+    deadline = now + timedelta(days=365)
     goal = create_goal(
         user_id="user_123",
         name="Completed Goal",
@@ -493,10 +724,10 @@ def test_get_goal_progress_not_found():
         get_goal_progress("nonexistent_id")
 
 
-def test_get_goal_progress_date_arithmetic():
+def test_get_goal_progress_date_arithmetic(now):
     """Test get_goal_progress handles month/year wraparound correctly."""
     # Create goal with deadline 15 months from now
-    deadline = datetime.utcnow() + timedelta(days=450)
+    deadline = now + timedelta(days=450)
     goal = create_goal(
         user_id="user_123",
         name="Long Term Goal",
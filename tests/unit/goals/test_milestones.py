@@ -10,18 +10,20 @@ Tests cover:
 - trigger_milestone_notification: Webhook integration (mocked)
 """
 
-from datetime import datetime, timedelta
+from datetime import timedelta
 from unittest.mock import AsyncMock, patch
 
 import pytest
 
 from fin_infra.goals import (
     create_goal,
+    update_goal,
 )
-from fin_infra.goals.management import _GOALS_STORE
+from fin_infra.goals.management import _GOALS_STORE, clear_goals_store
 from fin_infra.goals.milestones import (
     add_milestone,
     check_milestones,
+    check_milestones_for_user,
     get_celebration_message,
     get_milestone_progress,
     get_next_milestone,
@@ -34,17 +36,17 @@ from fin_infra.goals.milestones import (
 
 
 @pytest.fixture(autouse=True)
-def clear_goals_store():
+def reset_goals_store():
     """Clear the in-memory goals store before each test."""
-    _GOALS_STORE.clear()
+    clear_goals_store()
     yield
-    _GOALS_STORE.clear()
+    clear_goals_store()
 
 
 @pytest.fixture
-def sample_goal():
+def sample_goal(now):
     """Create a sample goal for milestone testing."""
-    deadline = datetime.utcnow() + timedelta(days=730)
+    deadline = now + timedelta(days=730)
     goal = create_goal(
         user_id="user_123",
         name="Emergency Fund",
@@ -61,9 +63,9 @@ def sample_goal():
 # ============================================================================
 
 
-def test_add_milestone_success(sample_goal):
+def test_add_milestone_success(sample_goal, now):
     """Test adding a milestone to a goal."""
-    target_date = datetime.utcnow() + timedelta(days=365)
+    target_date = now + timedelta(days=365)
     milestone = add_milestone(
         goal_id=sample_goal["id"],
         amount=12500.0,
@@ -136,6 +138,22 @@ def test_add_milestone_prevents_duplicates(sample_goal):
         )
 
 
+def test_add_milestone_prevents_duplicates_after_unsorted_update(sample_goal):
+    """Test duplicates are caught even when milestones were written out of order."""
+    update_goal(
+        sample_goal["id"],
+        {
+            "milestones": [
+                {"amount": 50000.0, "description": "Target"},
+                {"amount": 25000.0, "description": "Halfway"},
+            ]
+        },
+    )
+
+    with pytest.raises(ValueError, match="already exists"):
+        add_milestone(sample_goal["id"], 25000.0, "Duplicate")
+
+
 def test_add_milestone_sorts_by_amount(sample_goal):
     """Test add_milestone maintains sorted order by amount."""
     add_milestone(
@@ -213,6 +231,51 @@ def test_check_milestones_detects_multiple(sample_goal):
     assert reached[1]["amount"] == 25000.0
 
 
+def test_check_milestones_includes_exact_amount(sample_goal):
+    """Test check_milestones treats current_amount equal to a milestone as reached."""
+    add_milestone(sample_goal["id"], 12500.0, "25% to target", target_date=None)
+    add_milestone(sample_goal["id"], 25000.0, "50% to target", target_date=None)
+
+    _GOALS_STORE[sample_goal["id"]]["current_amount"] = 25000.0
+
+    reached = check_milestones(sample_goal["id"])
+
+    assert [m["amount"] for m in reached] == [12500.0, 25000.0]
+
+
+def test_check_milestones_with_unsorted_milestones_from_update_goal(sample_goal):
+    """Test milestones written out of amount order via update_goal."""
+    update_goal(
+        sample_goal["id"],
+        {
+            "milestones": [
+                {"amount": 50000.0, "description": "Target", "reached": False},
+                {"amount": 25000.0, "description": "Halfway", "reached": False},
+            ],
+            "current_amount": 30000.0,
+        },
+    )
+
+    reached = check_milestones(sample_goal["id"])
+
+    assert [m["amount"] for m in reached] == [25000.0]
+
+
+def test_check_milestones_defaults_missing_reached_flag(sample_goal):
+    """Test milestone dicts without a "reached" key count as not reached."""
+    update_goal(
+        sample_goal["id"],
+        {
+            "milestones": [{"amount": 25000.0, "description": "Halfway"}],
+            "current_amount": 30000.0,
+        },
+    )
+
+    reached = check_milestones(sample_goal["id"])
+
+    assert [m["amount"] for m in reached] == [25000.0]
+
+
 def test_check_milestones_returns_empty_when_none_reached(sample_goal):
     """Test check_milestones returns empty list when no milestones reached."""
     add_milestone(sample_goal["id"], 12500.0, "25% to target", target_date=None)
@@ -249,18 +312,51 @@ def test_check_milestones_no_milestones(sample_goal):
     assert reached == []
 
 
+def test_check_milestones_for_user_checks_every_goal(sample_goal, now):
+    """Test check_milestones_for_user reports newly reached milestones per goal."""
+    other_goal = create_goal(
+        user_id="user_123",
+        name="Vacation Fund",
+        goal_type="savings",
+        target_amount=10000.0,
+        deadline=now + timedelta(days=365),
+    )
+    untouched_goal = create_goal(
+        user_id="user_123",
+        name="New Car",
+        goal_type="savings",
+        target_amount=20000.0,
+        deadline=now + timedelta(days=365),
+    )
+    add_milestone(sample_goal["id"], 12500.0, "25% to target", target_date=None)
+    add_milestone(other_goal["id"], 5000.0, "Halfway", target_date=None)
+    add_milestone(untouched_goal["id"], 10000.0, "Halfway", target_date=None)
+    _GOALS_STORE[sample_goal["id"]]["current_amount"] = 15000.0
+    _GOALS_STORE[other_goal["id"]]["current_amount"] = 6000.0
+
+    reached = check_milestones_for_user("user_123")
+
+    assert set(reached) == {sample_goal["id"], other_goal["id"]}
+    assert reached[sample_goal["id"]][0]["amount"] == 12500.0
+    assert (
+        reached[sample_goal["id"]][0]["reached_date"]
+        == reached[other_goal["id"]][0]["reached_date"]
+    )
+    assert check_milestones_for_user("user_123") == {}
+
+
 # ============================================================================
 # get_celebration_message Tests
 # ============================================================================
 
 
-def test_get_celebration_message_25_percent():
+def test_get_celebration_message_25_percent(now):
     """Test get_celebration_message returns message for 25% milestone."""
     milestone = {
         "amount": 12500.0,
         "description": "25% to target",
         "reached": True,
-        "reached_date": datetime.utcnow(),
+        "reached_date": now,
     }
 
     message = get_celebration_message(milestone)
@@ -271,13 +367,13 @@ def test_get_celebration_message_25_percent():
     assert any(emoji in message for emoji in ["", "🎊", "🌟", "", ""])
 
 
-def test_get_celebration_message_50_percent():
+def test_get_celebration_message_50_percent(now):
     """Test get_celebration_message returns message for 50% milestone."""
     milestone = {
         "amount": 25000.0,
         "description": "50% to target",
         "reached": True,
-        "reached_date": datetime.utcnow(),
+        "reached_date": now,
     }
 
     message = get_celebration_message(milestone)
@@ -288,13 +384,13 @@ def test_get_celebration_message_50_percent():
     assert any(emoji in message for emoji in ["", "🎊", "🌟", "", ""])
 
 
-def test_get_celebration_message_75_percent():
+def test_get_celebration_message_75_percent(now):
     """Test get_celebration_message returns message for 75% milestone."""
     milestone = {
         "amount": 37500.0,
         "description": "75% to target",
         "reached": True,
-        "reached_date": datetime.utcnow(),
+        "reached_date": now,
     }
 
     message = get_celebration_message(milestone)
@@ -305,13 +401,13 @@ def test_get_celebration_message_75_percent():
     assert any(emoji in message for emoji in ["", "🎊", "🌟", "", ""])
 
 
-def test_get_celebration_message_90_percent():
+def test_get_celebration_message_90_percent(now):
     """Test get_celebration_message returns message for 90%+ milestone."""
     milestone = {
         "amount": 45000.0,
         "description": "90% to target",
         "reached": True,
-        "reached_date": datetime.utcnow(),
+        "reached_date": now,
     }
 
     message = get_celebration_message(milestone)
@@ -322,13 +418,13 @@ def test_get_celebration_message_90_percent():
     assert any(emoji in message for emoji in ["", "🎊", "🌟", "", ""])
 
 
-def test_get_celebration_message_default():
+def test_get_celebration_message_default(now):
     """Test get_celebration_message returns default message for other percentages."""
     milestone = {
         "amount": 10000.0,
         "description": "Custom milestone",
         "reached": True,
-        "reached_date": datetime.utcnow(),
+        "reached_date": now,
     }
 
     message = get_celebration_message(milestone)
@@ -457,13 +553,13 @@ def test_get_milestone_progress_goal_not_found():
     reason="AsyncClient not imported in milestones.py - webhook integration not testable yet"
 )
 @pytest.mark.asyncio
-async def test_trigger_milestone_notification_success(sample_goal):
+async def test_trigger_milestone_notification_success(sample_goal, now):
     """Test trigger_milestone_notification sends webhook."""
     milestone = {
         "amount": 12500.0,
         "description": "25% to target",
         "reached": True,
-        "reached_date": datetime.utcnow(),
+        "reached_date": now,
     }
 
     with patch("fin_infra.goals.milestones.AsyncClient") as mock_client_class:
@@ -492,13 +588,13 @@ async def test_trigger_milestone_notification_success(sample_goal):
     reason="AsyncClient not imported in milestones.py - webhook integration not testable yet"
 )
 @pytest.mark.asyncio
-async def test_trigger_milestone_notification_handles_error(sample_goal):
+async def test_trigger_milestone_notification_handles_error(sample_goal, now):
     """Test trigger_milestone_notification handles webhook errors gracefully."""
     milestone = {
         "amount": 12500.0,
         "description": "25% to target",
         "reached": True,
-        "reached_date": datetime.utcnow(),
+        "reached_date": now,
     }
 
     with patch("fin_infra.goals.milestones.AsyncClient") as mock_client_class:
@@ -532,13 +628,14 @@ def test_milestone_lifecycle(sample_goal):
     assert stats["reached_count"] == 0
 
     # Update progress to 15000 (past first milestone)
-    _GOALS_STORE[sample_goal["id"]]["current_amount"] = 15000.0
+    update_goal(sample_goal["id"], {"current_amount": 15000.0})
     reached = check_milestones(sample_goal["id"])
     assert len(reached) == 1
 
     # Get celebration message
     message = get_celebration_message(reached[0])
-    assert "" in message
+    assert "$12,500" in message
+    assert "25% to target" in message
 
     # Check stats
     stats = get_milestone_progress(sample_goal["id"])
@@ -550,7 +647,7 @@ def test_milestone_lifecycle(sample_goal):
     assert next_m["amount"] == 25000.0
 
     # Update progress to 50000 (all milestones reached)
-    _GOALS_STORE[sample_goal["id"]]["current_amount"] = 50000.0
+    update_goal(sample_goal["id"], {"current_amount": 50000.0})
     reached = check_milestones(sample_goal["id"])
     assert len(reached) == 2  # Two more reached
 
@@ -1,6 +1,6 @@
 """Unit tests for insights aggregation logic."""
 
-from datetime import datetime, timedelta
+from datetime import timedelta
 from decimal import Decimal
 
 import pytest
@@ -17,14 +17,13 @@ from fin_infra.recurring.models import CadenceType, PatternType, RecurringPatter
 # ---- Fixtures ----
 
 
-@pytest.fixture
-def net_worth_snapshots():
-    """Sample net worth snapshots."""
+def _make_snapshots(now, latest_net_worth):
+    """Month-apart snapshot pair moving net worth from 100k to latest_net_worth."""
     return [
         NetWorthSnapshot(
             id="snap_1",
             user_id="user_123",
-            snapshot_date=datetime.now() - timedelta(days=30),
+            snapshot_date=now - timedelta(days=30),
             total_net_worth=100000.0,
             total_assets=120000.0,
             total_liabilities=20000.0,
@@ -32,20 +31,23 @@ def net_worth_snapshots():
         NetWorthSnapshot(
             id="snap_2",
             user_id="user_123",
-            snapshot_date=datetime.now(),
-            total_net_worth=105000.0,
-            total_assets=127000.0,
-            total_liabilities=22000.0,
+            snapshot_date=now,
+            total_net_worth=latest_net_worth,
+            total_assets=latest_net_worth + 20000.0,
+            total_liabilities=20000.0,
         ),
     ]
 
 
+# Model fixtures are module-scoped: aggregate_insights only reads its inputs, so tests
+# can share one validated instance instead of rebuilding it each time.
+
 # Budget testing removed - Budget model doesn't have spent field
 # Budget insights require external spending data, so testing is simplified
 
 
-@pytest.fixture
-def goals_in_progress():
+@pytest.fixture(scope="module")
+def goals_in_progress(now):
     """Goals with partial progress."""
     return [
         Goal(
@@ -56,13 +58,13 @@ def goals_in_progress():
             status=GoalStatus.ACTIVE,
             target_amount=10000.0,
             current_amount=5000.0,
-            deadline=datetime.now() + timedelta(days=365),
+            deadline=now + timedelta(days=365),
         )
     ]
 
 
-@pytest.fixture
-def goals_near_completion():
+@pytest.fixture(scope="module")
+def goals_near_completion(now):
     """Goals at 75%+ completion."""
     return [
         Goal(
@@ -73,13 +75,13 @@ def goals_near_completion():
             status=GoalStatus.ACTIVE,
             target_amount=5000.0,
             current_amount=4000.0,
-            deadline=datetime.now() + timedelta(days=90),
+            deadline=now + timedelta(days=90),
         )
     ]
 
 
-@pytest.fixture
-def goals_achieved():
+@pytest.fixture(scope="module")
+def goals_achieved(now):
     """Goals that are 100%+ complete."""
     return [
         Goal(
@@ -90,15 +92,14 @@ def goals_achieved():
             status=GoalStatus.COMPLETED,  # Mark as completed
             target_amount=2000.0,
             current_amount=2000.0,  # Must be <= target_amount
-            deadline=datetime.now() + timedelta(days=30),
+            deadline=now + timedelta(days=30),
         )
     ]
 
 
-@pytest.fixture
-def recurring_patterns_low_cost():
+@pytest.fixture(scope="module")
+def recurring_patterns_low_cost(now):
     """Recurring patterns under $50/month."""
-    base_date = datetime.now()
     return [
         RecurringPattern(
             merchant_name="SPOTIFY.COM",
@@ -108,19 +109,18 @@ def recurring_patterns_low_cost():
             amount=9.99,
             amount_variance_pct=0.0,
             occurrence_count=12,
-            first_date=base_date - timedelta(days=365),
-            last_date=base_date - timedelta(days=30),
-            next_expected_date=base_date + timedelta(days=15),
+            first_date=now - timedelta(days=365),
+            last_date=now - timedelta(days=30),
+            next_expected_date=now + timedelta(days=15),
             date_std_dev=0.5,
             confidence=0.95,
         )
     ]
 
 
-@pytest.fixture
-def recurring_patterns_high_cost():
+@pytest.fixture(scope="module")
+def recurring_patterns_high_cost(now):
     """Recurring patterns over $50/month."""
-    base_date = datetime.now()
     return [
         RecurringPattern(
             merchant_name="GEICO INSURANCE",
@@ -130,9 +130,9 @@ def recurring_patterns_high_cost():
             amount=120.00,
             amount_variance_pct=0.0,
             occurrence_count=12,
-            first_date=base_date - timedelta(days=365),
-            last_date=base_date - timedelta(days=10),
-            next_expected_date=base_date + timedelta(days=20),
+            first_date=now - timedelta(days=365),
+            last_date=now - timedelta(days=10),
+            next_expected_date=now + timedelta(days=20),
             date_std_dev=1.0,
             confidence=0.98,
         ),
@@ -144,9 +144,9 @@ def recurring_patterns_high_cost():
             amount=65.00,
             amount_variance_pct=0.0,
             occurrence_count=6,
-            first_date=base_date - timedelta(days=180),
-            last_date=base_date - timedelta(days=20),
-            next_expected_date=base_date + timedelta(days=10),
+            first_date=now - timedelta(days=180),
+            last_date=now - timedelta(days=20),
+            next_expected_date=now + timedelta(days=10),
             date_std_dev=1.5,
             confidence=0.92,
         ),
@@ -156,81 +156,44 @@ def recurring_patterns_high_cost():
 # ---- Test aggregate_insights() ----
 
 
-def test_aggregate_insights_empty():
+@pytest.fixture(scope="module")
+def empty_feed():
+    """Feed aggregated with no data sources; shared by tests that only read it."""
+    return aggregate_insights(user_id="user_123")
+
+
+def test_aggregate_insights_empty(empty_feed):
     """Test aggregation with no data sources."""
-    feed = aggregate_insights(user_id="user_123")
+    feed = empty_feed
     assert feed.user_id == "user_123"
     assert feed.insights == []
     assert feed.unread_count == 0
     assert feed.critical_count == 0
 
 
-def test_net_worth_increase(net_worth_snapshots):
-    """Test insight for net worth increase."""
-    feed = aggregate_insights(user_id="user_123", net_worth_snapshots=net_worth_snapshots)
-
-    assert len(feed.insights) == 1
-    insight = feed.insights[0]
-    assert insight.category == InsightCategory.NET_WORTH
-    assert insight.priority == InsightPriority.MEDIUM
-    assert "Increased" in insight.title
-    assert insight.value == Decimal("5000")  # 105000 - 100000
-
-
-def test_net_worth_decrease():
-    """Test insight for net worth decrease."""
-    snapshots = [
-        NetWorthSnapshot(
-            id="snap_1",
-            user_id="user_123",
-            snapshot_date=datetime.now() - timedelta(days=30),
-            total_net_worth=100000.0,
-            total_assets=120000.0,
-            total_liabilities=20000.0,
-        ),
-        NetWorthSnapshot(
-            id="snap_2",
-            user_id="user_123",
-            snapshot_date=datetime.now(),
-            total_net_worth=90000.0,
-            total_assets=110000.0,
-            total_liabilities=20000.0,
-        ),
-    ]
+@pytest.mark.parametrize(
+    ("latest_net_worth", "expected_priority", "expected_title", "expected_change"),
+    [
+        (105000.0, InsightPriority.MEDIUM, "Increased", Decimal("5000")),
+        (90000.0, InsightPriority.MEDIUM, "Decreased", Decimal("-10000")),  # <10% decline
+        (80000.0, InsightPriority.HIGH, "Decreased", Decimal("-20000")),  # >10% decline
+    ],
+    ids=["increase", "decrease", "large_decrease"],
+)
+def test_net_worth_change(
+    now, latest_net_worth, expected_priority, expected_title, expected_change
+):
+    """Test net worth insight priority and title for the change between snapshots."""
+    snapshots = _make_snapshots(now, latest_net_worth)
 
     feed = aggregate_insights(user_id="user_123", net_worth_snapshots=snapshots)
-    assert len(feed.insights) == 1
-    insight = feed.insights[0]
-    assert insight.category == InsightCategory.NET_WORTH
-    assert insight.priority == InsightPriority.MEDIUM  # <10% decline
-    assert "Decreased" in insight.title
-
 
-def test_net_worth_large_decrease():
-    """Test insight for large net worth decrease (>10%)."""
-    snapshots = [
-        NetWorthSnapshot(
-            id="snap_1",
-            user_id="user_123",
-            snapshot_date=datetime.now() - timedelta(days=30),
-            total_net_worth=100000.0,
-            total_assets=120000.0,
-            total_liabilities=20000.0,
-        ),
-        NetWorthSnapshot(
-            id="snap_2",
-            user_id="user_123",
-            snapshot_date=datetime.now(),
-            total_net_worth=80000.0,
-            total_assets=100000.0,
-            total_liabilities=20000.0,
-        ),
-    ]
-
-    feed = aggregate_insights(user_id="user_123", net_worth_snapshots=snapshots)
     assert len(feed.insights) == 1
     insight = feed.insights[0]
-    assert insight.priority == InsightPriority.HIGH  # >10% decline
+    assert insight.category == InsightCategory.NET_WORTH
+    assert insight.priority == expected_priority
+    assert expected_title in insight.title
+    assert insight.value == expected_change
 
 
 # Budget tests removed - Budget model doesn't have spent tracking
@@ -349,11 +312,10 @@ def test_unread_count():
         # In production, would recalculate or track separately
 
 
-def test_critical_count():
+def test_critical_count(empty_feed):
     """Test critical count calculation."""
     # No critical-priority data sources in current fixtures
-    feed = aggregate_insights(user_id="user_123")
-    assert feed.critical_count == 0
+    assert empty_feed.critical_count == 0
 
 
 def test_get_user_insights_stub():
@@ -15,6 +15,18 @@ from fin_infra.investments.models import (
 )
 from fin_infra.investments.providers.base import InvestmentProvider
 
+# Amounts shared by several fixtures and tests, parsed once at import
+_AAPL_PRICE = Decimal("175.50")
+_AAPL_VALUE = Decimal("1755.00")  # 10 shares
+_CASH_PRICE = Decimal("1.00")
+
+# Expected figures for sample_holdings (total value 6000)
+_TOTAL_VALUE = 6000.0  # 1755 + 2100 + 1500 + 645
+_EQUITY_PCT = 29.25  # 1755 / 6000
+_ETF_PCT = 35.0  # 2100 / 6000
+_BOND_PCT = 25.0  # 1500 / 6000
+_CASH_PCT = 10.75  # 645 / 6000
+
 
 # Test implementation of abstract base class
 class MockInvestmentProvider(InvestmentProvider):
@@ -45,26 +57,61 @@ class MockInvestmentProvider(InvestmentProvider):
         return []
 
 
-@pytest.fixture
+# Security without sector information
+_NO_SECTOR_SECURITY = Security(
+    security_id="sec_no_sector",
+    ticker_symbol="TEST",
+    name="Test Security",
+    type=SecurityType.equity,
+    close_price=Decimal("100.00"),
+    currency="USD",
+)
+
+
+def _holding(
+    security: Security,
+    *,
+    quantity: Decimal,
+    institution_price: Decimal,
+    institution_value: Decimal,
+    cost_basis: Decimal | None = None,
+) -> Holding:
+    """USD holding in acc_1, built without validation (inputs are known-good test data)."""
+    return Holding.model_construct(
+        account_id="acc_1",
+        security=security,
+        quantity=quantity,
+        institution_price=institution_price,
+        institution_value=institution_value,
+        cost_basis=cost_basis,
+        currency="USD",
+    )
+
+
+# Fixtures are module-scoped: the provider is stateless and the helpers under test only
+# read holdings and securities, so one instance of each is shared by every test.
+
+
+@pytest.fixture(scope="module")
 def provider() -> MockInvestmentProvider:
     """Create a mock provider instance."""
     return MockInvestmentProvider()
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_securities() -> list[Security]:
-    """Create sample securities for testing."""
+    """Create sample securities for testing (known-good data, so validation is skipped)."""
     return [
-        Security(
+        Security.model_construct(
             security_id="sec_equity_1",
             ticker_symbol="AAPL",
             name="Apple Inc.",
             type=SecurityType.equity,
             sector="Technology",
-            close_price=Decimal("175.50"),
+            close_price=_AAPL_PRICE,
             currency="USD",
         ),
-        Security(
+        Security.model_construct(
             security_id="sec_etf_1",
             ticker_symbol="VOO",
             name="Vanguard S&P 500 ETF",
@@ -73,7 +120,7 @@ def sample_securities() -> list[Security]:
             close_price=Decimal("420.00"),
             currency="USD",
         ),
-        Security(
+        Security.model_construct(
             security_id="sec_bond_1",
             ticker_symbol="BND",
             name="Vanguard Total Bond Market ETF",
@@ -81,18 +128,18 @@ def sample_securities() -> list[Security]:
             close_price=Decimal("75.00"),
             currency="USD",
         ),
-        Security(
+        Security.model_construct(
             security_id="sec_cash_1",
             ticker_symbol="USD",
             name="US Dollar",
             type=SecurityType.cash,
-            close_price=Decimal("1.00"),
+            close_price=_CASH_PRICE,
             currency="USD",
         ),
     ]
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_holdings(sample_securities: list[Security]) -> list[Holding]:
     """Create sample holdings for testing."""
     return [
@@ -100,8 +147,8 @@ def sample_holdings(sample_securities: list[Security]) -> list[Holding]:
             account_id="acc_1",
             security=sample_securities[0],  # AAPL
             quantity=Decimal("10"),
-            institution_price=Decimal("175.50"),
-            institution_value=Decimal("1755.00"),
+            institution_price=_AAPL_PRICE,
+            institution_value=_AAPL_VALUE,
             cost_basis=Decimal("1500.00"),
             currency="USD",
         ),
@@ -127,7 +174,7 @@ def sample_holdings(sample_securities: list[Security]) -> list[Holding]:
             account_id="acc_1",
             security=sample_securities[3],  # Cash
             quantity=Decimal("645.00"),
-            institution_price=Decimal("1.00"),
+            institution_price=_CASH_PRICE,
             institution_value=Decimal("645.00"),
             cost_basis=Decimal("645.00"),
             currency="USD",
@@ -148,10 +195,10 @@ class TestCalculateAllocation:
         allocation = provider.calculate_allocation(sample_holdings)
 
         assert isinstance(allocation, AssetAllocation)
-        assert allocation.by_security_type[SecurityType.equity] == 29.25  # 1755 / 6000
-        assert allocation.by_security_type[SecurityType.etf] == 35.0  # 2100 / 6000
-        assert allocation.by_security_type[SecurityType.bond] == 25.0  # 1500 / 6000
-        assert allocation.cash_percent == 10.75  # 645 / 6000
+        assert allocation.by_security_type[SecurityType.equity] == _EQUITY_PCT
+        assert allocation.by_security_type[SecurityType.etf] == _ETF_PCT
+        assert allocation.by_security_type[SecurityType.bond] == _BOND_PCT
+        assert allocation.cash_percent == _CASH_PCT
 
     def test_calculate_allocation_by_sector(
         self, provider: MockInvestmentProvider, sample_holdings: list[Holding]
@@ -160,93 +207,76 @@ class TestCalculateAllocation:
         allocation = provider.calculate_allocation(sample_holdings)
 
         assert "Technology" in allocation.by_sector
-        assert allocation.by_sector["Technology"] == 29.25  # AAPL only
+        assert allocation.by_sector["Technology"] == _EQUITY_PCT  # AAPL only
         assert "Diversified" in allocation.by_sector
-        assert allocation.by_sector["Diversified"] == 35.0  # VOO only
-
-    def test_calculate_allocation_empty_holdings(self, provider: MockInvestmentProvider):
-        """Test allocation calculation with empty holdings list."""
-        allocation = provider.calculate_allocation([])
-
-        assert allocation.by_security_type == {}
-        assert allocation.by_sector == {}
-        assert allocation.cash_percent == 0.0
-
-    def test_calculate_allocation_only_cash(
-        self, provider: MockInvestmentProvider, sample_securities: list[Security]
-    ):
-        """Test allocation calculation with only cash holdings."""
-        cash_holdings = [
-            Holding(
-                account_id="acc_1",
-                security=sample_securities[3],  # Cash
-                quantity=Decimal("1000.00"),
-                institution_price=Decimal("1.00"),
-                institution_value=Decimal("1000.00"),
-                cost_basis=Decimal("1000.00"),
-                currency="USD",
-            )
-        ]
-
-        allocation = provider.calculate_allocation(cash_holdings)
-
-        assert allocation.by_security_type == {}
-        assert allocation.by_sector == {}
-        assert allocation.cash_percent == 100.0
-
-    def test_calculate_allocation_no_sector_data(
-        self, provider: MockInvestmentProvider, sample_securities: list[Security]
-    ):
-        """Test allocation calculation when securities have no sector information."""
-        # Create security without sector
-        security_no_sector = Security(
-            security_id="sec_no_sector",
-            ticker_symbol="TEST",
-            name="Test Security",
-            type=SecurityType.equity,
-            close_price=Decimal("100.00"),
-            currency="USD",
-        )
-
-        holdings = [
-            Holding(
-                account_id="acc_1",
-                security=security_no_sector,
-                quantity=Decimal("10"),
-                institution_price=Decimal("100.00"),
-                institution_value=Decimal("1000.00"),
-                cost_basis=Decimal("900.00"),
-                currency="USD",
-            )
-        ]
-
-        allocation = provider.calculate_allocation(holdings)
-
-        assert allocation.by_security_type[SecurityType.equity] == 100.0
-        assert allocation.by_sector == {}  # No sector data
-        assert allocation.cash_percent == 0.0
-
-    def test_calculate_allocation_zero_value_holdings(
-        self, provider: MockInvestmentProvider, sample_securities: list[Security]
+        assert allocation.by_sector["Diversified"] == _ETF_PCT  # VOO only
+
+    @pytest.mark.parametrize(
+        ("build_holdings", "expected_by_type", "expected_by_sector", "expected_cash_percent"),
+        [
+            pytest.param(lambda securities: [], {}, {}, 0.0, id="empty_holdings"),
+            pytest.param(
+                lambda securities: [
+                    _holding(
+                        securities[3],  # Cash
+                        quantity=Decimal("1000.00"),
+                        institution_price=_CASH_PRICE,
+                        institution_value=Decimal("1000.00"),
+                        cost_basis=Decimal("1000.00"),
+                    )
+                ],
+                {},
+                {},
+                100.0,
+                id="only_cash",
+            ),
+            pytest.param(
+                lambda securities: [
+                    _holding(
+                        _NO_SECTOR_SECURITY,
+                        quantity=Decimal("10"),
+                        institution_price=Decimal("100.00"),
+                        institution_value=Decimal("1000.00"),
+                        cost_basis=Decimal("900.00"),
+                    )
+                ],
+                {SecurityType.equity: 100.0},
+                {},  # No sector data
+                0.0,
+                id="no_sector_data",
+            ),
+            pytest.param(
+                lambda securities: [
+                    _holding(
+                        securities[0],
+                        quantity=Decimal("0"),
+                        institution_price=_AAPL_PRICE,
+                        institution_value=Decimal("0.00"),
+                        cost_basis=Decimal("0.00"),
+                    )
+                ],
+                {},
+                {},
+                0.0,
+                id="zero_value_holdings",
+            ),
+        ],
+    )
+    def test_calculate_allocation_scenarios(
+        self,
+        provider: MockInvestmentProvider,
+        sample_securities: list[Security],
+        build_holdings,
+        expected_by_type: dict[SecurityType, float],
+        expected_by_sector: dict[str, float],
+        expected_cash_percent: float,
     ):
-        """Test allocation calculation when holdings have zero value."""
-        zero_holdings = [
-            Holding(
-                account_id="acc_1",
-                security=sample_securities[0],
-                quantity=Decimal("0"),
-                institution_price=Decimal("175.50"),
-                institution_value=Decimal("0.00"),
-                cost_basis=Decimal("0.00"),
-                currency="USD",
-            )
-        ]
-
-        allocation = provider.calculate_allocation(zero_holdings)
+        """Test allocation for edge-case portfolios (empty, cash-only, no sector, zero value)."""
+        allocation = provider.calculate_allocation(build_holdings(sample_securities))
 
-        assert allocation.by_security_type == {}
-        assert allocation.by_sector == {}
-        assert allocation.cash_percent == 0.0
+        assert allocation.by_security_type == expected_by_type
+        assert allocation.by_sector == expected_by_sector
+        assert allocation.cash_percent == expected_cash_percent
 
 
 # Tests for calculate_portfolio_metrics()
@@ -261,7 +291,7 @@ class TestCalculatePortfolioMetrics:
         """Test basic portfolio metrics calculation."""
         metrics = provider.calculate_portfolio_metrics(sample_holdings)
 
-        assert metrics["total_value"] == 6000.0  # 1755 + 2100 + 1500 + 645
+        assert metrics["total_value"] == _TOTAL_VALUE
         assert metrics["total_cost_basis"] == 5695.0  # 1500 + 2000 + 1550 + 645
         assert metrics["total_unrealized_gain_loss"] == 305.0  # 6000 - 5695
         assert metrics["total_unrealized_gain_loss_percent"] == pytest.approx(
@@ -273,14 +303,12 @@ class TestCalculatePortfolioMetrics:
     ):
         """Test portfolio metrics when holdings have unrealized losses."""
         losing_holdings = [
-            Holding(
-                account_id="acc_1",
-                security=sample_securities[0],
+            _holding(
+                sample_securities[0],
                 quantity=Decimal("10"),
                 institution_price=Decimal("100.00"),
                 institution_value=Decimal("1000.00"),
                 cost_basis=Decimal("1500.00"),
-                currency="USD",
             )
         ]
 
@@ -305,13 +333,11 @@ class TestCalculatePortfolioMetrics:
     ):
         """Test portfolio metrics when holdings have no cost basis."""
         no_cost_holdings = [
-            Holding(
-                account_id="acc_1",
-                security=sample_securities[0],
+            _holding(
+                sample_securities[0],
                 quantity=Decimal("10"),
-                institution_price=Decimal("175.50"),
-                institution_value=Decimal("1755.00"),
-                currency="USD",
+                institution_price=_AAPL_PRICE,
+                institution_value=_AAPL_VALUE,
             )
         ]
 
@@ -327,24 +353,23 @@ class TestCalculatePortfolioMetrics:
     ):
         """Test that metrics are properly rounded to 2 decimal places."""
         holdings = [
-            Holding(
-                account_id="acc_1",
-                security=sample_securities[0],
+            _holding(
+                sample_securities[0],
                 quantity=Decimal("3"),
                 institution_price=Decimal("33.333333"),
                 institution_value=Decimal("99.999999"),
                 cost_basis=Decimal("90.123456"),
-                currency="USD",
             )
         ]
 
         metrics = provider.calculate_portfolio_metrics(holdings)
 
-        assert metrics["total_value"] == pytest.approx(100.0, abs=0.01)  # Rounded
-        assert metrics["total_cost_basis"] == pytest.approx(90.12, abs=0.01)  # Rounded
-        assert metrics["total_unrealized_gain_loss"] == pytest.approx(9.88, abs=0.01)  # Rounded
+        # Rounded values compare exactly: round(x, 2) yields the same float as the literal
+        assert metrics["total_value"] == 100.0
+        assert metrics["total_cost_basis"] == 90.12
+        assert metrics["total_unrealized_gain_loss"] == 9.88
         # (9.876543 / 90.123456) * 100 = 10.95967... -> 10.96
-        assert metrics["total_unrealized_gain_loss_percent"] == pytest.approx(10.96, abs=0.01)
+        assert metrics["total_unrealized_gain_loss_percent"] == 10.96
 
 
 # Tests for _normalize_security_type()
@@ -353,41 +378,38 @@ class TestCalculatePortfolioMetrics:
 class TestNormalizeSecurityType:
     """Tests for _normalize_security_type() helper method."""
 
-    def test_normalize_plaid_types(self, provider: MockInvestmentProvider):
-        """Test normalization of Plaid security types."""
-        assert provider._normalize_security_type("equity") == SecurityType.equity
-        assert provider._normalize_security_type("etf") == SecurityType.etf
-        assert provider._normalize_security_type("mutual fund") == SecurityType.mutual_fund
-        assert provider._normalize_security_type("bond") == SecurityType.bond
-        assert provider._normalize_security_type("cash") == SecurityType.cash
-        assert provider._normalize_security_type("derivative") == SecurityType.derivative
-
-    def test_normalize_snaptrade_types(self, provider: MockInvestmentProvider):
-        """Test normalization of SnapTrade security types (abbreviations)."""
-        assert provider._normalize_security_type("cs") == SecurityType.equity  # common stock
-        assert provider._normalize_security_type("mf") == SecurityType.mutual_fund
-        assert provider._normalize_security_type("o") == SecurityType.derivative  # option
-
-    def test_normalize_case_insensitive(self, provider: MockInvestmentProvider):
-        """Test that normalization is case-insensitive."""
-        assert provider._normalize_security_type("EQUITY") == SecurityType.equity
-        assert provider._normalize_security_type("Equity") == SecurityType.equity
-        assert provider._normalize_security_type("EqUiTy") == SecurityType.equity
-
-    def test_normalize_with_whitespace(self, provider: MockInvestmentProvider):
-        """Test that normalization handles whitespace."""
-        assert provider._normalize_security_type("  equity  ") == SecurityType.equity
-        assert provider._normalize_security_type("mutual fund") == SecurityType.mutual_fund
-
-    def test_normalize_unknown_type(self, provider: MockInvestmentProvider):
-        """Test that unknown types default to SecurityType.other."""
-        assert provider._normalize_security_type("unknown") == SecurityType.other
-        assert provider._normalize_security_type("xyz") == SecurityType.other
-        assert provider._normalize_security_type("") == SecurityType.other
-
-    def test_normalize_explicit_other(self, provider: MockInvestmentProvider):
-        """Test explicit 'other' type."""
-        assert provider._normalize_security_type("other") == SecurityType.other
+    @pytest.mark.parametrize(
+        ("raw_type", "expected"),
+        [
+            # Plaid security types
+            ("equity", SecurityType.equity),
+            ("etf", SecurityType.etf),
+            ("mutual fund", SecurityType.mutual_fund),
+            ("bond", SecurityType.bond),
+            ("cash", SecurityType.cash),
+            ("derivative", SecurityType.derivative),
+            # SnapTrade abbreviations
+            ("cs", SecurityType.equity),  # common stock
+            ("mf", SecurityType.mutual_fund),
+            ("o", SecurityType.derivative),  # option
+            # Case-insensitive
+            ("EQUITY", SecurityType.equity),
+            ("Equity", SecurityType.equity),
+            ("EqUiTy", SecurityType.equity),
+            # Surrounding whitespace
+            ("  equity  ", SecurityType.equity),
+            # Unknown types default to other
+            ("unknown", SecurityType.other),
+            ("xyz", SecurityType.other),
+            ("", SecurityType.other),
+            ("other", SecurityType.other),
+        ],
+    )
+    def test_normalize_security_type(
+        self, provider: MockInvestmentProvider, raw_type: str, expected: SecurityType
+    ):
+        """Test provider security type strings map to SecurityType."""
+        assert provider._normalize_security_type(raw_type) == expected
 
 
 # Tests for abstract methods (ensure they raise NotImplementedError)
@@ -396,8 +418,7 @@ class TestNormalizeSecurityType:
 class TestAbstractMethods:
     """Tests to verify abstract methods are properly defined."""
 
-    @pytest.mark.asyncio
-    async def test_abstract_methods_not_callable(self):
+    def test_abstract_methods_not_callable(self):
         """Test that abstract base class cannot be instantiated directly."""
         with pytest.raises(TypeError, match="Can't instantiate abstract class"):
             InvestmentProvider()  # type: ignore
@@ -424,12 +445,10 @@ class TestIntegration:
         assert abs(total_allocation - 100.0) < 0.01  # Allow for rounding
 
         # Verify metrics are consistent with allocation
-        assert metrics["total_value"] == 6000.0
-        assert allocation.cash_percent == (645 / 6000) * 100  # 10.75%
+        assert metrics["total_value"] == _TOTAL_VALUE
+        assert allocation.cash_percent == _CASH_PCT
 
-    def test_normalize_securities_in_holdings(
-        self, provider: MockInvestmentProvider, sample_securities: list[Security]
-    ):
+    def test_normalize_securities_in_holdings(self, provider: MockInvestmentProvider):
         """Test normalizing security types for holdings from different providers."""
         provider_types = ["equity", "EQUITY", "cs", "  equity  "]
 
@@ -2,7 +2,8 @@
 
 from datetime import date
 from decimal import Decimal
-from unittest.mock import Mock, patch
+from types import SimpleNamespace
+from unittest.mock import DEFAULT, MagicMock, Mock, patch
 
 import pytest
 
@@ -10,6 +11,7 @@ import pytest
 try:
     import plaid  # noqa: F401
     from plaid.api import plaid_api as _plaid_api  # noqa: F401
+    from plaid.exceptions import ApiException
 
     HAS_PLAID = True
 except ImportError:
@@ -27,26 +29,105 @@ from fin_infra.investments.models import (  # noqa: E402
 )
 from fin_infra.investments.providers.plaid import PlaidInvestmentProvider  # noqa: E402
 
+_PROVIDER_MODULE = "fin_infra.investments.providers.plaid"
+
+_AAPL_QUANTITY = Decimal("10.0")
+_AAPL_PRICE = Decimal("175.50")
+_AAPL_VALUE = Decimal("1755.00")  # 10 shares
+_AAPL_COST_BASIS = Decimal("1500.00")
+_ACCOUNT_TOTAL_VALUE = Decimal("4210.0")  # balance 1755 + holdings 1755 + 700
+
+# Input security for the transform tests; never mutated.
+_AAPL_SECURITY = Security(
+    security_id="sec_aapl_123",
+    ticker_symbol="AAPL",
+    name="Apple Inc.",
+    type=SecurityType.equity,
+    close_price=_AAPL_PRICE,
+    currency="USD",
+)
+
+_EXPECTED_AAPL_SECURITY = {
+    "security_id": "sec_aapl_123",
+    "ticker_symbol": "AAPL",
+    "name": "Apple Inc.",
+    "type": SecurityType.equity,
+    "sector": "Technology",
+    "close_price": _AAPL_PRICE,
+}
+_EXPECTED_AAPL_HOLDING = {
+    "account_id": "acc_401k_123",
+    "quantity": _AAPL_QUANTITY,
+    "institution_price": _AAPL_PRICE,
+    "institution_value": _AAPL_VALUE,
+    "cost_basis": _AAPL_COST_BASIS,
+}
+_EXPECTED_AAPL_TRANSACTION = {
+    "transaction_id": "tx_buy_123",
+    "account_id": "acc_401k_123",
+    "transaction_type": TransactionType.buy,
+    "quantity": _AAPL_QUANTITY,
+    "amount": _AAPL_VALUE,
+    "price": _AAPL_PRICE,
+}
+
+
+def _fields(model, expected):
+    """Dump a model once and pick out the fields named in ``expected``."""
+    dumped = model.model_dump()
+    return {key: dumped[key] for key in expected}
+
+
+def _returns(value):
+    """Stub a Plaid client method that always returns ``value``."""
+    return lambda *args, **kwargs: value
+
+
+def _raises(error):
+    """Stub a Plaid client method that always raises ``error``."""
+
+    def _raise(*args, **kwargs):
+        raise error
+
+    return _raise
+
+
+def _api_error(status, reason, code, msg):
+    """Build a Plaid ApiException carrying an error code and display message."""
+    error = ApiException(status=status, reason=reason)
+    error.error_code = code
+    error.display_message = msg
+    return error
 
-@pytest.fixture
-def provider():
-    """Create PlaidInvestmentProvider instance."""
-    with patch("fin_infra.investments.providers.plaid.ApiClient"):
-        with patch("fin_infra.investments.providers.plaid.plaid_api.PlaidApi"):
-            provider = PlaidInvestmentProvider(
-                client_id="test_client_id",
-                secret="test_secret",
-                environment="sandbox",
-            )
-            return provider
+
+@pytest.fixture(scope="module", autouse=True)
+def _patch_plaid_sdk():
+    """Stub the Plaid SDK client classes for every test in the module."""
+    with patch.multiple(_PROVIDER_MODULE, ApiClient=DEFAULT, plaid_api=DEFAULT) as mocks:
+        yield mocks
+
+
+@pytest.fixture(scope="module")
+def plaid_provider():
+    """Create one PlaidInvestmentProvider instance for the module."""
+    return PlaidInvestmentProvider(
+        client_id="test_client_id",
+        secret="test_secret",
+        environment="sandbox",
+    )
 
 
 @pytest.fixture
+def provider(plaid_provider):
+    """Shared provider with a fresh mocked Plaid client, so stubs don't leak between tests."""
+    plaid_provider.client = MagicMock()
+    return plaid_provider
+
+
+@pytest.fixture(scope="module")
 def mock_plaid_security():
     """Create mock Plaid security response."""
-    security = Mock()
-    security.security_id = "sec_aapl_123"
-    security.to_dict.return_value = {
+    payload = {
         "security_id": "sec_aapl_123",
         "cusip": "037833100",
         "isin": "US0378331005",
@@ -60,14 +141,13 @@ def mock_plaid_security():
         "market_identifier_code": "XNAS",
         "iso_currency_code": "USD",
     }
-    return security
+    return SimpleNamespace(security_id=payload["security_id"], to_dict=lambda: payload)
 
 
-@pytest.fixture
-def mock_plaid_holding(mock_plaid_security):
+@pytest.fixture(scope="module")
+def mock_plaid_holding():
     """Create mock Plaid holding response."""
-    holding = Mock()
-    holding.to_dict.return_value = {
+    payload = {
         "account_id": "acc_401k_123",
         "security_id": "sec_aapl_123",
         "quantity": 10.0,
@@ -77,14 +157,13 @@ def mock_plaid_holding(mock_plaid_security):
         "iso_currency_code": "USD",
         "unofficial_currency_code": None,
     }
-    return holding
+    return SimpleNamespace(to_dict=lambda: payload)
 
 
-@pytest.fixture
-def mock_plaid_transaction(mock_plaid_security):
+@pytest.fixture(scope="module")
+def mock_plaid_transaction():
     """Create mock Plaid investment transaction response."""
-    transaction = Mock()
-    transaction.to_dict.return_value = {
+    payload = {
         "investment_transaction_id": "tx_buy_123",
         "account_id": "acc_401k_123",
         "security_id": "sec_aapl_123",
@@ -99,15 +178,13 @@ def mock_plaid_transaction(mock_plaid_security):
         "iso_currency_code": "USD",
         "unofficial_currency_code": None,
     }
-    return transaction
+    return SimpleNamespace(to_dict=lambda: payload)
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_plaid_account():
     """Create mock Plaid account response."""
-    account = Mock()
-    account.account_id = "acc_401k_123"
-    account.to_dict.return_value = {
+    payload = {
         "account_id": "acc_401k_123",
         "name": "401(k) Account",
         "official_name": "Vanguard 401(k)",
@@ -118,7 +195,54 @@ def mock_plaid_account():
             "available": 1755.00,
         },
     }
-    return account
+    return SimpleNamespace(account_id=payload["account_id"], to_dict=lambda: payload)
+
+
+@pytest.fixture(scope="module")
+def plaid_holdings_response(mock_plaid_security, mock_plaid_holding, mock_plaid_account):
+    """Create a Plaid holdings response with one AAPL holding in the 401(k) account."""
+    return SimpleNamespace(
+        securities=[mock_plaid_security],
+        holdings=[mock_plaid_holding],
+        accounts=[mock_plaid_account],
+    )
+
+
+@pytest.fixture(scope="module")
+def make_security():
+    """Factory for minimal Plaid equity security payloads."""
+
+    def _make(security_id, ticker, name, price):
+        payload = {
+            "security_id": security_id,
+            "ticker_symbol": ticker,
+            "name": name,
+            "type": "equity",
+            "close_price": price,
+            "iso_currency_code": "USD",
+        }
+        return SimpleNamespace(security_id=security_id, to_dict=lambda: payload)
+
+    return _make
+
+
+@pytest.fixture(scope="module")
+def make_holding():
+    """Factory for Plaid holding payloads in the 401(k) account."""
+
+    def _make(security_id, quantity, price, value, cost_basis):
+        payload = {
+            "account_id": "acc_401k_123",
+            "security_id": security_id,
+            "quantity": quantity,
+            "institution_price": price,
+            "institution_value": value,
+            "cost_basis": cost_basis,
+            "iso_currency_code": "USD",
+        }
+        return SimpleNamespace(to_dict=lambda: payload)
+
+    return _make
 
 
 # Tests for __init__
@@ -127,18 +251,17 @@ def mock_plaid_account():
 class TestInit:
     """Tests for PlaidInvestmentProvider initialization."""
 
-    def test_init_success(self):
+    def test_init_success(self, _patch_plaid_sdk):
         """Test successful initialization with valid credentials."""
-        with patch("fin_infra.investments.providers.plaid.ApiClient"):
-            with patch("fin_infra.investments.providers.plaid.plaid_api.PlaidApi"):
-                provider = PlaidInvestmentProvider(
-                    client_id="test_client",
-                    secret="test_secret",
-                    environment="sandbox",
-                )
-                assert provider.client_id == "test_client"
-                assert provider.secret == "test_secret"
-                assert provider.environment == "sandbox"
+        provider = PlaidInvestmentProvider(
+            client_id="test_client",
+            secret="test_secret",
+            environment="sandbox",
+        )
+        assert provider.client_id == "test_client"
+        assert provider.secret == "test_secret"
+        assert provider.environment == "sandbox"
+        assert provider.client is _patch_plaid_sdk["plaid_api"].PlaidApi.return_value
 
     def test_init_missing_credentials(self):
         """Test initialization fails with missing credentials."""
@@ -147,13 +270,11 @@ class TestInit:
 
     def test_init_default_environment(self):
         """Test initialization with default sandbox environment."""
-        with patch("fin_infra.investments.providers.plaid.ApiClient"):
-            with patch("fin_infra.investments.providers.plaid.plaid_api.PlaidApi"):
-                provider = PlaidInvestmentProvider(
-                    client_id="test_client",
-                    secret="test_secret",
-                )
-                assert provider.environment == "sandbox"
+        provider = PlaidInvestmentProvider(
+            client_id="test_client",
+            secret="test_secret",
+        )
+        assert provider.environment == "sandbox"
 
 
 # Tests for get_holdings
@@ -162,15 +283,10 @@ class TestInit:
 class TestGetHoldings:
     """Tests for get_holdings method."""
 
-    @pytest.mark.asyncio
-    async def test_get_holdings_success(self, provider, mock_plaid_security, mock_plaid_holding):
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_get_holdings_success(self, provider, plaid_holdings_response):
         """Test successful holdings retrieval."""
-        # Mock Plaid API response
-        mock_response = Mock()
-        mock_response.securities = [mock_plaid_security]
-        mock_response.holdings = [mock_plaid_holding]
-
-        provider.client.investments_holdings_get = Mock(return_value=mock_response)
+        provider.client.investments_holdings_get = _returns(plaid_holdings_response)
 
         # Call method
         holdings = await provider.get_holdings("access_token_123")
@@ -179,23 +295,13 @@ class TestGetHoldings:
         assert len(holdings) == 1
         holding = holdings[0]
         assert isinstance(holding, Holding)
-        assert holding.account_id == "acc_401k_123"
+        assert _fields(holding, _EXPECTED_AAPL_HOLDING) == _EXPECTED_AAPL_HOLDING
         assert holding.security.ticker_symbol == "AAPL"
-        assert holding.quantity == Decimal("10.0")
-        assert holding.institution_price == Decimal("175.50")
-        assert holding.institution_value == Decimal("1755.00")
-        assert holding.cost_basis == Decimal("1500.00")
-
-    @pytest.mark.asyncio
-    async def test_get_holdings_with_account_filter(
-        self, provider, mock_plaid_security, mock_plaid_holding
-    ):
-        """Test holdings retrieval with account ID filter."""
-        mock_response = Mock()
-        mock_response.securities = [mock_plaid_security]
-        mock_response.holdings = [mock_plaid_holding]
 
-        provider.client.investments_holdings_get = Mock(return_value=mock_response)
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_get_holdings_with_account_filter(self, provider, plaid_holdings_response):
+        """Test holdings retrieval with account ID filter."""
+        provider.client.investments_holdings_get = Mock(return_value=plaid_holdings_response)
 
         # Call with account filter
         await provider.get_holdings("access_token_123", account_ids=["acc_401k_123"])
@@ -204,29 +310,12 @@ class TestGetHoldings:
         call_args = provider.client.investments_holdings_get.call_args
         assert call_args is not None
 
-    @pytest.mark.asyncio
-    async def test_get_holdings_empty(self, provider):
-        """Test holdings retrieval with no holdings."""
-        mock_response = Mock()
-        mock_response.securities = []
-        mock_response.holdings = []
-
-        provider.client.investments_holdings_get = Mock(return_value=mock_response)
-
-        holdings = await provider.get_holdings("access_token_123")
-
-        assert holdings == []
-
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_get_holdings_api_error(self, provider):
         """Test holdings retrieval with API error."""
-        from plaid.exceptions import ApiException
+        error = _api_error(401, "Unauthorized", "INVALID_ACCESS_TOKEN", "Invalid access token")
 
-        error = ApiException(status=401, reason="Unauthorized")
-        error.error_code = "INVALID_ACCESS_TOKEN"
-        error.display_message = "Invalid access token"
-
-        provider.client.investments_holdings_get = Mock(side_effect=error)
+        provider.client.investments_holdings_get = _raises(error)
 
         with pytest.raises(ValueError, match="Invalid Plaid access token"):
             await provider.get_holdings("invalid_token")
@@ -238,16 +327,17 @@ class TestGetHoldings:
 class TestGetTransactions:
     """Tests for get_transactions method."""
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_get_transactions_success(
         self, provider, mock_plaid_security, mock_plaid_transaction
     ):
         """Test successful transactions retrieval."""
-        mock_response = Mock()
-        mock_response.securities = [mock_plaid_security]
-        mock_response.investment_transactions = [mock_plaid_transaction]
+        mock_response = SimpleNamespace(
+            securities=[mock_plaid_security],
+            investment_transactions=[mock_plaid_transaction],
+        )
 
-        provider.client.investments_transactions_get = Mock(return_value=mock_response)
+        provider.client.investments_transactions_get = _returns(mock_response)
 
         # Call method
         start_date = date(2025, 11, 1)
@@ -258,24 +348,20 @@ class TestGetTransactions:
         assert len(transactions) == 1
         tx = transactions[0]
         assert isinstance(tx, InvestmentTransaction)
-        assert tx.transaction_id == "tx_buy_123"
-        assert tx.account_id == "acc_401k_123"
+        assert _fields(tx, _EXPECTED_AAPL_TRANSACTION) == _EXPECTED_AAPL_TRANSACTION
         assert tx.security.ticker_symbol == "AAPL"
-        assert tx.transaction_type == TransactionType.buy
-        assert tx.quantity == Decimal("10.0")
-        assert tx.amount == Decimal("1755.00")
-        assert tx.price == Decimal("175.50")
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_get_transactions_with_account_filter(
         self, provider, mock_plaid_security, mock_plaid_transaction
     ):
         """Test transactions retrieval with account filter."""
-        mock_response = Mock()
-        mock_response.securities = [mock_plaid_security]
-        mock_response.investment_transactions = [mock_plaid_transaction]
+        mock_response = SimpleNamespace(
+            securities=[mock_plaid_security],
+            investment_transactions=[mock_plaid_transaction],
+        )
 
-        provider.client.investments_transactions_get = Mock(return_value=mock_response)
+        provider.client.investments_transactions_get = _returns(mock_response)
 
         start_date = date(2025, 11, 1)
         end_date = date(2025, 11, 20)
@@ -285,29 +371,16 @@ class TestGetTransactions:
 
         assert len(transactions) == 1
 
-    @pytest.mark.asyncio
-    async def test_get_transactions_invalid_date_range(self, provider):
+    def test_get_transactions_invalid_date_range(self, provider):
         """Test transactions retrieval with invalid date range."""
         start_date = date(2025, 11, 20)
         end_date = date(2025, 11, 1)  # End before start
 
+        # The date check runs before the first await, so stepping the coroutine
+        # once raises without needing an event loop.
+        coro = provider.get_transactions("access_token_123", start_date, end_date)
         with pytest.raises(ValueError, match="start_date must be before end_date"):
-            await provider.get_transactions("access_token_123", start_date, end_date)
-
-    @pytest.mark.asyncio
-    async def test_get_transactions_empty(self, provider):
-        """Test transactions retrieval with no transactions."""
-        mock_response = Mock()
-        mock_response.securities = []
-        mock_response.investment_transactions = []
-
-        provider.client.investments_transactions_get = Mock(return_value=mock_response)
-
-        start_date = date(2025, 11, 1)
-        end_date = date(2025, 11, 20)
-        transactions = await provider.get_transactions("access_token_123", start_date, end_date)
-
-        assert transactions == []
+            coro.send(None)
 
 
 # Tests for get_securities
@@ -316,13 +389,10 @@ class TestGetTransactions:
 class TestGetSecurities:
     """Tests for get_securities method."""
 
-    @pytest.mark.asyncio
-    async def test_get_securities_success(self, provider, mock_plaid_security):
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_get_securities_success(self, provider, plaid_holdings_response):
         """Test successful securities retrieval."""
-        mock_response = Mock()
-        mock_response.securities = [mock_plaid_security]
-
-        provider.client.investments_holdings_get = Mock(return_value=mock_response)
+        provider.client.investments_holdings_get = _returns(plaid_holdings_response)
 
         # Call method
         securities = await provider.get_securities("access_token_123", ["sec_aapl_123"])
@@ -331,43 +401,18 @@ class TestGetSecurities:
         assert len(securities) == 1
         security = securities[0]
         assert isinstance(security, Security)
-        assert security.security_id == "sec_aapl_123"
-        assert security.ticker_symbol == "AAPL"
-        assert security.name == "Apple Inc."
-        assert security.type == SecurityType.equity
-        assert security.sector == "Technology"
-        assert security.close_price == Decimal("175.50")
-
-    @pytest.mark.asyncio
-    async def test_get_securities_filter(self, provider):
+        assert _fields(security, _EXPECTED_AAPL_SECURITY) == _EXPECTED_AAPL_SECURITY
+
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_get_securities_filter(self, provider, make_security):
         """Test securities retrieval filters by requested IDs."""
         # Create multiple securities
-        sec1 = Mock()
-        sec1.security_id = "sec_aapl_123"
-        sec1.to_dict.return_value = {
-            "security_id": "sec_aapl_123",
-            "ticker_symbol": "AAPL",
-            "name": "Apple Inc.",
-            "type": "equity",
-            "close_price": 175.50,
-            "iso_currency_code": "USD",
-        }
-
-        sec2 = Mock()
-        sec2.security_id = "sec_googl_456"
-        sec2.to_dict.return_value = {
-            "security_id": "sec_googl_456",
-            "ticker_symbol": "GOOGL",
-            "name": "Alphabet Inc.",
-            "type": "equity",
-            "close_price": 140.00,
-            "iso_currency_code": "USD",
-        }
+        sec1 = make_security("sec_aapl_123", "AAPL", "Apple Inc.", 175.50)
+        sec2 = make_security("sec_googl_456", "GOOGL", "Alphabet Inc.", 140.00)
 
-        mock_response = Mock()
-        mock_response.securities = [sec1, sec2]
+        mock_response = SimpleNamespace(securities=[sec1, sec2])
 
-        provider.client.investments_holdings_get = Mock(return_value=mock_response)
+        provider.client.investments_holdings_get = _returns(mock_response)
 
         # Request only AAPL
         securities = await provider.get_securities("access_token_123", ["sec_aapl_123"])
@@ -383,21 +428,10 @@ class TestGetSecurities:
 class TestGetInvestmentAccounts:
     """Tests for get_investment_accounts method."""
 
-    @pytest.mark.asyncio
-    async def test_get_investment_accounts_success(
-        self,
-        provider,
-        mock_plaid_security,
-        mock_plaid_holding,
-        mock_plaid_account,
-    ):
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_get_investment_accounts_success(self, provider, plaid_holdings_response):
         """Test successful investment accounts retrieval."""
-        mock_response = Mock()
-        mock_response.securities = [mock_plaid_security]
-        mock_response.holdings = [mock_plaid_holding]
-        mock_response.accounts = [mock_plaid_account]
-
-        provider.client.investments_holdings_get = Mock(return_value=mock_response)
+        provider.client.investments_holdings_get = _returns(plaid_holdings_response)
 
         # Call method
         accounts = await provider.get_investment_accounts("access_token_123")
@@ -417,60 +451,25 @@ class TestGetInvestmentAccounts:
         assert account.total_value > 0
         assert account.total_cost_basis > 0
 
-    @pytest.mark.asyncio
-    async def test_get_investment_accounts_multiple_holdings(self, provider, mock_plaid_account):
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_get_investment_accounts_multiple_holdings(
+        self, provider, mock_plaid_account, make_security, make_holding
+    ):
         """Test account with multiple holdings."""
         # Create multiple securities and holdings
-        sec1 = Mock()
-        sec1.security_id = "sec_aapl_123"
-        sec1.to_dict.return_value = {
-            "security_id": "sec_aapl_123",
-            "ticker_symbol": "AAPL",
-            "name": "Apple Inc.",
-            "type": "equity",
-            "close_price": 175.50,
-            "iso_currency_code": "USD",
-        }
+        sec1 = make_security("sec_aapl_123", "AAPL", "Apple Inc.", 175.50)
+        sec2 = make_security("sec_googl_456", "GOOGL", "Alphabet Inc.", 140.00)
 
-        sec2 = Mock()
-        sec2.security_id = "sec_googl_456"
-        sec2.to_dict.return_value = {
-            "security_id": "sec_googl_456",
-            "ticker_symbol": "GOOGL",
-            "name": "Alphabet Inc.",
-            "type": "equity",
-            "close_price": 140.00,
-            "iso_currency_code": "USD",
-        }
+        holding1 = make_holding("sec_aapl_123", 10.0, 175.50, 1755.00, 1500.00)
+        holding2 = make_holding("sec_googl_456", 5.0, 140.00, 700.00, 650.00)
 
-        holding1 = Mock()
-        holding1.to_dict.return_value = {
-            "account_id": "acc_401k_123",
-            "security_id": "sec_aapl_123",
-            "quantity": 10.0,
-            "institution_price": 175.50,
-            "institution_value": 1755.00,
-            "cost_basis": 1500.00,
-            "iso_currency_code": "USD",
-        }
-
-        holding2 = Mock()
-        holding2.to_dict.return_value = {
-            "account_id": "acc_401k_123",
-            "security_id": "sec_googl_456",
-            "quantity": 5.0,
-            "institution_price": 140.00,
-            "institution_value": 700.00,
-            "cost_basis": 650.00,
-            "iso_currency_code": "USD",
-        }
-
-        mock_response = Mock()
-        mock_response.securities = [sec1, sec2]
-        mock_response.holdings = [holding1, holding2]
-        mock_response.accounts = [mock_plaid_account]
+        mock_response = SimpleNamespace(
+            securities=[sec1, sec2],
+            holdings=[holding1, holding2],
+            accounts=[mock_plaid_account],
+        )
 
-        provider.client.investments_holdings_get = Mock(return_value=mock_response)
+        provider.client.investments_holdings_get = _returns(mock_response)
 
         # Call method
         accounts = await provider.get_investment_accounts("access_token_123")
@@ -480,7 +479,46 @@ class TestGetInvestmentAccounts:
         account = accounts[0]
         assert len(account.holdings) == 2
         # total_value = balance.current (1755) + holdings (1755 + 700) = 4210
-        assert account.total_value == Decimal("4210.0")
+        assert account.total_value == _ACCOUNT_TOTAL_VALUE
+
+
+# Tests for empty Plaid responses
+
+
+class TestEmptyResponses:
+    """Tests that every fetch method returns an empty list for an empty response."""
+
+    @pytest.mark.parametrize(
+        "method,attr,call",
+        [
+            ("investments_holdings_get", "holdings", lambda p: p.get_holdings("access_token_123")),
+            (
+                "investments_transactions_get",
+                "investment_transactions",
+                lambda p: p.get_transactions(
+                    "access_token_123", date(2025, 11, 1), date(2025, 11, 20)
+                ),
+            ),
+            (
+                "investments_holdings_get",
+                "holdings",
+                lambda p: p.get_securities("access_token_123", ["sec_aapl_123"]),
+            ),
+            (
+                "investments_holdings_get",
+                "holdings",
+                lambda p: p.get_investment_accounts("access_token_123"),
+            ),
+        ],
+        ids=["holdings", "transactions", "securities", "investment_accounts"],
+    )
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_empty_response(self, provider, method, attr, call):
+        """Test retrieval with no securities and no records."""
+        response = SimpleNamespace(securities=[], accounts=[], **{attr: []})
+        setattr(provider.client, method, _returns(response))
+
+        assert await call(provider) == []
 
 
 # Tests for helper methods
@@ -495,90 +533,70 @@ class TestHelperMethods:
         security = provider._transform_security(plaid_dict)
 
         assert isinstance(security, Security)
-        assert security.security_id == "sec_aapl_123"
-        assert security.ticker_symbol == "AAPL"
-        assert security.type == SecurityType.equity
+        assert _fields(security, _EXPECTED_AAPL_SECURITY) == _EXPECTED_AAPL_SECURITY
 
     def test_transform_holding(self, provider, mock_plaid_holding):
         """Test holding transformation."""
         plaid_dict = mock_plaid_holding.to_dict()
-        security = Security(
-            security_id="sec_aapl_123",
-            ticker_symbol="AAPL",
-            name="Apple Inc.",
-            type=SecurityType.equity,
-            close_price=Decimal("175.50"),
-            currency="USD",
-        )
-
-        holding = provider._transform_holding(plaid_dict, security)
+        holding = provider._transform_holding(plaid_dict, _AAPL_SECURITY)
 
         assert isinstance(holding, Holding)
-        assert holding.account_id == "acc_401k_123"
-        assert holding.quantity == Decimal("10.0")
-        assert holding.institution_value == Decimal("1755.00")
+        assert _fields(holding, _EXPECTED_AAPL_HOLDING) == _EXPECTED_AAPL_HOLDING
 
     def test_transform_transaction(self, provider, mock_plaid_transaction):
         """Test transaction transformation."""
         plaid_dict = mock_plaid_transaction.to_dict()
-        security = Security(
-            security_id="sec_aapl_123",
-            ticker_symbol="AAPL",
-            name="Apple Inc.",
-            type=SecurityType.equity,
-            close_price=Decimal("175.50"),
-            currency="USD",
-        )
-
-        transaction = provider._transform_transaction(plaid_dict, security)
+        transaction = provider._transform_transaction(plaid_dict, _AAPL_SECURITY)
 
         assert isinstance(transaction, InvestmentTransaction)
-        assert transaction.transaction_id == "tx_buy_123"
-        assert transaction.transaction_type == TransactionType.buy
-        assert transaction.quantity == Decimal("10.0")
-
-    def test_normalize_transaction_type(self, provider):
+        assert _fields(transaction, _EXPECTED_AAPL_TRANSACTION) == _EXPECTED_AAPL_TRANSACTION
+
+    @pytest.mark.parametrize(
+        "plaid_type,expected",
+        [
+            ("buy", TransactionType.buy),
+            ("sell", TransactionType.sell),
+            ("dividend", TransactionType.dividend),
+            ("unknown", TransactionType.other),
+        ],
+    )
+    def test_normalize_transaction_type(self, provider, plaid_type, expected):
         """Test transaction type normalization."""
-        assert provider._normalize_transaction_type("buy") == TransactionType.buy
-        assert provider._normalize_transaction_type("sell") == TransactionType.sell
-        assert provider._normalize_transaction_type("dividend") == TransactionType.dividend
-        assert provider._normalize_transaction_type("unknown") == TransactionType.other
-
-    def test_transform_error_invalid_token(self, provider):
-        """Test error transformation for invalid token."""
-        from plaid.exceptions import ApiException
-
-        error = ApiException(status=401, reason="Unauthorized")
-        error.error_code = "INVALID_ACCESS_TOKEN"
-        error.display_message = "Invalid access token"
-
-        transformed = provider._transform_error(error)
-
-        assert isinstance(transformed, ValueError)
-        assert "Invalid Plaid access token" in str(transformed)
-
-    def test_transform_error_rate_limit(self, provider):
-        """Test error transformation for rate limit."""
-        from plaid.exceptions import ApiException
-
-        error = ApiException(status=429, reason="Too Many Requests")
-        error.error_code = "RATE_LIMIT_EXCEEDED"
-        error.display_message = "Rate limit exceeded"
-
-        transformed = provider._transform_error(error)
-
-        assert isinstance(transformed, ValueError)
-        assert "rate limit exceeded" in str(transformed)
-
-    def test_transform_error_generic(self, provider):
-        """Test error transformation for generic error."""
-        from plaid.exceptions import ApiException
-
-        error = ApiException(status=500, reason="Internal Server Error")
-        error.error_code = "INTERNAL_SERVER_ERROR"
-        error.display_message = "Something went wrong"
-
-        transformed = provider._transform_error(error)
-
-        assert isinstance(transformed, Exception)
-        assert "Plaid API error" in str(transformed)
+        assert provider._normalize_transaction_type(plaid_type) == expected
+
+    @pytest.mark.parametrize(
+        "status,reason,code,msg,exc_cls,match",
+        [
+            (
+                401,
+                "Unauthorized",
+                "INVALID_ACCESS_TOKEN",
+                "Invalid access token",
+                ValueError,
+                "Invalid Plaid access token",
+            ),
+            (
+                429,
+                "Too Many Requests",
+                "RATE_LIMIT_EXCEEDED",
+                "Rate limit exceeded",
+                ValueError,
+                "rate limit exceeded",
+            ),
+            (
+                500,
+                "Internal Server Error",
+                "INTERNAL_SERVER_ERROR",
+                "Something went wrong",
+                Exception,
+                "Plaid API error",
+            ),
+        ],
+        ids=["invalid_token", "rate_limit", "generic"],
+    )
+    def test_transform_error(self, provider, status, reason, code, msg, exc_cls, match):
+        """Test error transformation for Plaid API errors."""
+        transformed = provider._transform_error(_api_error(status, reason, code, msg))
+
+        assert isinstance(transformed, exc_cls)
+        assert match in str(transformed)
@@ -13,9 +13,9 @@ from fin_infra.investments.providers.snaptrade import SnapTradeInvestmentProvide
 # Fixtures
 
 
-@pytest.fixture
-def provider():
-    """Create SnapTrade provider instance."""
+@pytest.fixture(scope="module")
+def snaptrade_provider():
+    """Create one SnapTrade provider instance for the module."""
     return SnapTradeInvestmentProvider(
         client_id="test_client_id",
         consumer_key="test_consumer_key",
@@ -24,6 +24,30 @@ def provider():
 
 
 @pytest.fixture
+def provider(snaptrade_provider, monkeypatch):
+    """Shared provider whose client.get is restored after each test."""
+    monkeypatch.setattr(snaptrade_provider.client, "get", snaptrade_provider.client.get)
+    return snaptrade_provider
+
+
+@pytest.fixture
+def serve(provider, monkeypatch):
+    """Answer the provider's HTTP calls with canned JSON, keyed by endpoint name.
+
+    The last URL path segment picks the payload, e.g. ``accounts`` or ``positions``.
+    """
+
+    def _serve(**payloads):
+        def handler(request):
+            return httpx.Response(200, json=payloads[request.url.path.rsplit("/", 1)[-1]])
+
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        monkeypatch.setattr(provider, "client", client)
+
+    return _serve
+
+
+@pytest.fixture(scope="module")
 def mock_snaptrade_account():
     """Mock SnapTrade account data."""
     return {
@@ -35,7 +59,7 @@ def mock_snaptrade_account():
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_snaptrade_position():
     """Mock SnapTrade position data."""
     return {
@@ -53,7 +77,7 @@ def mock_snaptrade_position():
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_snaptrade_transaction():
     """Mock SnapTrade transaction data."""
     return {
@@ -75,7 +99,7 @@ def mock_snaptrade_transaction():
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_snaptrade_balances():
     """Mock SnapTrade balances data."""
     return {
@@ -125,26 +149,11 @@ def test_init_missing_consumer_key():
 
 
 @pytest.mark.asyncio
-async def test_get_holdings_success(provider, mock_snaptrade_account, mock_snaptrade_position):
+async def test_get_holdings_success(
+    provider, serve, mock_snaptrade_account, mock_snaptrade_position
+):
     """Test successful holdings retrieval."""
-    # Mock httpx client responses
-    mock_accounts_response = AsyncMock()
-    mock_accounts_response.json.return_value = [mock_snaptrade_account]
-    mock_accounts_response.raise_for_status = Mock()
-
-    mock_positions_response = AsyncMock()
-    mock_positions_response.json.return_value = [mock_snaptrade_position]
-    mock_positions_response.raise_for_status = Mock()
-
-    # Mock client.get to return different responses based on URL
-    async def mock_get(url, params=None, headers=None):
-        if "accounts" in url and "positions" not in url:
-            return mock_accounts_response
-        elif "positions" in url:
-            return mock_positions_response
-        return AsyncMock()
-
-    provider.client.get = AsyncMock(side_effect=mock_get)
+    serve(accounts=[mock_snaptrade_account], positions=[mock_snaptrade_position])
 
     # Test get_holdings
     holdings = await provider.get_holdings("user_123:secret_abc")
@@ -163,7 +172,7 @@ async def test_get_holdings_success(provider, mock_snaptrade_account, mock_snapt
 
 @pytest.mark.asyncio
 async def test_get_holdings_filtered_accounts(
-    provider, mock_snaptrade_account, mock_snaptrade_position
+    provider, serve, mock_snaptrade_account, mock_snaptrade_position
 ):
     """Test holdings retrieval with account_ids filter."""
     # Create two accounts
@@ -172,22 +181,7 @@ async def test_get_holdings_filtered_accounts(
     account2 = mock_snaptrade_account.copy()
     account2["id"] = "acc_456"
 
-    mock_accounts_response = AsyncMock()
-    mock_accounts_response.json.return_value = [account1, account2]
-    mock_accounts_response.raise_for_status = Mock()
-
-    mock_positions_response = AsyncMock()
-    mock_positions_response.json.return_value = [mock_snaptrade_position]
-    mock_positions_response.raise_for_status = Mock()
-
-    async def mock_get(url, params=None, headers=None):
-        if "accounts" in url and "positions" not in url:
-            return mock_accounts_response
-        elif "positions" in url:
-            return mock_positions_response
-        return AsyncMock()
-
-    provider.client.get = AsyncMock(side_effect=mock_get)
+    serve(accounts=[account1, account2], positions=[mock_snaptrade_position])
 
     # Test with filter
     holdings = await provider.get_holdings("user_123:secret_abc", account_ids=["acc_123"])
@@ -203,21 +197,22 @@ async def test_get_holdings_invalid_access_token(provider):
     with pytest.raises(ValueError, match="Invalid access_token format"):
         await provider.get_holdings("invalid_token_format")
 
-    @pytest.mark.asyncio
-    async def test_get_holdings_api_error(provider):
-        """Test holdings retrieval handles API errors."""
-        mock_response = Mock()  # Use Mock not AsyncMock for error responses
-        mock_response.status_code = 401
-        mock_response.text = "Unauthorized"
-        mock_response.json.return_value = {"message": "Invalid credentials"}
-        mock_response.raise_for_status.side_effect = httpx.HTTPStatusError(
-            message="401", request=Mock(), response=mock_response
-        )
 
-        provider.client.get = AsyncMock(return_value=mock_response)
+@pytest.mark.asyncio
+async def test_get_holdings_api_error(provider):
+    """Test holdings retrieval handles API errors."""
+    mock_response = Mock()  # Use Mock not AsyncMock for error responses
+    mock_response.status_code = 401
+    mock_response.text = "Unauthorized"
+    mock_response.json.return_value = {"message": "Invalid credentials"}
+    mock_response.raise_for_status.side_effect = httpx.HTTPStatusError(
+        message="401", request=Mock(), response=mock_response
+    )
+
+    provider.client.get = AsyncMock(return_value=mock_response)
 
-        with pytest.raises(ValueError, match="Invalid SnapTrade credentials"):
-            await provider.get_holdings("user_123:secret_abc")
+    with pytest.raises(ValueError, match="Invalid SnapTrade credentials"):
+        await provider.get_holdings("user_123:secret_abc")
 
 
 # Test get_transactions
@@ -225,25 +220,10 @@ async def test_get_holdings_invalid_access_token(provider):
 
 @pytest.mark.asyncio
 async def test_get_transactions_success(
-    provider, mock_snaptrade_account, mock_snaptrade_transaction
+    provider, serve, mock_snaptrade_account, mock_snaptrade_transaction
 ):
     """Test successful transactions retrieval."""
-    mock_accounts_response = AsyncMock()
-    mock_accounts_response.json.return_value = [mock_snaptrade_account]
-    mock_accounts_response.raise_for_status = Mock()
-
-    mock_transactions_response = AsyncMock()
-    mock_transactions_response.json.return_value = [mock_snaptrade_transaction]
-    mock_transactions_response.raise_for_status = Mock()
-
-    async def mock_get(url, params=None, headers=None):
-        if "accounts" in url and "transactions" not in url:
-            return mock_accounts_response
-        elif "transactions" in url:
-            return mock_transactions_response
-        return AsyncMock()
-
-    provider.client.get = AsyncMock(side_effect=mock_get)
+    serve(accounts=[mock_snaptrade_account], transactions=[mock_snaptrade_transaction])
 
     # Test get_transactions
     start_date = date(2024, 1, 1)
@@ -276,7 +256,7 @@ async def test_get_transactions_invalid_date_range(provider):
 
 @pytest.mark.asyncio
 async def test_get_transactions_filtered_accounts(
-    provider, mock_snaptrade_account, mock_snaptrade_transaction
+    provider, serve, mock_snaptrade_account, mock_snaptrade_transaction
 ):
     """Test transactions retrieval with account_ids filter."""
     account1 = mock_snaptrade_account.copy()
@@ -284,22 +264,7 @@ async def test_get_transactions_filtered_accounts(
     account2 = mock_snaptrade_account.copy()
     account2["id"] = "acc_456"
 
-    mock_accounts_response = AsyncMock()
-    mock_accounts_response.json.return_value = [account1, account2]
-    mock_accounts_response.raise_for_status = Mock()
-
-    mock_transactions_response = AsyncMock()
-    mock_transactions_response.json.return_value = [mock_snaptrade_transaction]
-    mock_transactions_response.raise_for_status = Mock()
-
-    async def mock_get(url, params=None, headers=None):
-        if "accounts" in url and "transactions" not in url:
-            return mock_accounts_response
-        elif "transactions" in url:
-            return mock_transactions_response
-        return AsyncMock()
-
-    provider.client.get = AsyncMock(side_effect=mock_get)
+    serve(accounts=[account1, account2], transactions=[mock_snaptrade_transaction])
 
     start_date = date(2024, 1, 1)
     end_date = date(2024, 1, 31)
@@ -315,12 +280,10 @@ async def test_get_transactions_filtered_accounts(
 
 
 @pytest.mark.asyncio
-async def test_get_securities_success(provider, mock_snaptrade_account, mock_snaptrade_position):
+async def test_get_securities_success(
+    provider, serve, mock_snaptrade_account, mock_snaptrade_position
+):
     """Test successful securities retrieval."""
-    mock_accounts_response = AsyncMock()
-    mock_accounts_response.json.return_value = [mock_snaptrade_account]
-    mock_accounts_response.raise_for_status = Mock()
-
     # Create positions with different symbols
     position_aapl = mock_snaptrade_position.copy()
     position_googl = mock_snaptrade_position.copy()
@@ -331,18 +294,7 @@ async def test_get_securities_success(provider, mock_snaptrade_account, mock_sna
         "type": "stock",
     }
 
-    mock_positions_response = AsyncMock()
-    mock_positions_response.json.return_value = [position_aapl, position_googl]
-    mock_positions_response.raise_for_status = Mock()
-
-    async def mock_get(url, params=None, headers=None):
-        if "accounts" in url and "positions" not in url:
-            return mock_accounts_response
-        elif "positions" in url:
-            return mock_positions_response
-        return AsyncMock()
-
-    provider.client.get = AsyncMock(side_effect=mock_get)
+    serve(accounts=[mock_snaptrade_account], positions=[position_aapl, position_googl])
 
     # Test get_securities
     securities = await provider.get_securities("user_123:secret_abc", ["AAPL", "GOOGL"])
@@ -354,12 +306,10 @@ async def test_get_securities_success(provider, mock_snaptrade_account, mock_sna
 
 
 @pytest.mark.asyncio
-async def test_get_securities_filtered(provider, mock_snaptrade_account, mock_snaptrade_position):
+async def test_get_securities_filtered(
+    provider, serve, mock_snaptrade_account, mock_snaptrade_position
+):
     """Test securities retrieval with symbol filter."""
-    mock_accounts_response = AsyncMock()
-    mock_accounts_response.json.return_value = [mock_snaptrade_account]
-    mock_accounts_response.raise_for_status = Mock()
-
     position_aapl = mock_snaptrade_position.copy()
     position_googl = mock_snaptrade_position.copy()
     position_googl["symbol"] = {
@@ -369,18 +319,7 @@ async def test_get_securities_filtered(provider, mock_snaptrade_account, mock_sn
         "type": "stock",
     }
 
-    mock_positions_response = AsyncMock()
-    mock_positions_response.json.return_value = [position_aapl, position_googl]
-    mock_positions_response.raise_for_status = Mock()
-
-    async def mock_get(url, params=None, headers=None):
-        if "accounts" in url and "positions" not in url:
-            return mock_accounts_response
-        elif "positions" in url:
-            return mock_positions_response
-        return AsyncMock()
-
-    provider.client.get = AsyncMock(side_effect=mock_get)
+    serve(accounts=[mock_snaptrade_account], positions=[position_aapl, position_googl])
 
     # Only request AAPL
     securities = await provider.get_securities("user_123:secret_abc", ["AAPL"])
@@ -395,32 +334,17 @@ async def test_get_securities_filtered(provider, mock_snaptrade_account, mock_sn
 @pytest.mark.asyncio
 async def test_get_investment_accounts_success(
     provider,
+    serve,
     mock_snaptrade_account,
     mock_snaptrade_position,
     mock_snaptrade_balances,
 ):
     """Test successful investment accounts retrieval."""
-    mock_accounts_response = AsyncMock()
-    mock_accounts_response.json.return_value = [mock_snaptrade_account]
-    mock_accounts_response.raise_for_status = Mock()
-
-    mock_positions_response = AsyncMock()
-    mock_positions_response.json.return_value = [mock_snaptrade_position]
-    mock_positions_response.raise_for_status = Mock()
-
-    mock_balances_response = AsyncMock()
-    mock_balances_response.json.return_value = mock_snaptrade_balances
-    mock_balances_response.raise_for_status = Mock()
-
-    async def mock_get(url, params=None, headers=None):
-        if "balances" in url:
-            return mock_balances_response
-        elif "positions" in url:
-            return mock_positions_response
-        else:
-            return mock_accounts_response
-
-    provider.client.get = AsyncMock(side_effect=mock_get)
+    serve(
+        accounts=[mock_snaptrade_account],
+        positions=[mock_snaptrade_position],
+        balances=mock_snaptrade_balances,
+    )
 
     # Test get_investment_accounts
     accounts = await provider.get_investment_accounts("user_123:secret_abc")
@@ -444,7 +368,7 @@ async def test_get_investment_accounts_success(
 
 
 @pytest.mark.asyncio
-async def test_list_connections_success(provider):
+async def test_list_connections_success(provider, serve):
     """Test successful connections list retrieval."""
     mock_connections = [
         {
@@ -458,12 +382,7 @@ async def test_list_connections_success(provider):
             "status": "active",
         },
     ]
-
-    mock_response = AsyncMock()
-    mock_response.json.return_value = mock_connections
-    mock_response.raise_for_status = Mock()
-
-    provider.client.get = AsyncMock(return_value=mock_response)
+    serve(connections=mock_connections)
 
     # Test list_connections
     connections = await provider.list_connections("user_123:secret_abc")
@@ -475,13 +394,9 @@ async def test_list_connections_success(provider):
 
 
 @pytest.mark.asyncio
-async def test_list_connections_empty(provider):
+async def test_list_connections_empty(provider, serve):
     """Test connections list when no connections exist."""
-    mock_response = AsyncMock()
-    mock_response.json.return_value = []
-    mock_response.raise_for_status = Mock()
-
-    provider.client.get = AsyncMock(return_value=mock_response)
+    serve(connections=[])
 
     connections = await provider.list_connections("user_123:secret_abc")
 
@@ -491,44 +406,49 @@ async def test_list_connections_empty(provider):
 # Test get_brokerage_capabilities
 
 
-def test_get_brokerage_capabilities_robinhood(provider):
-    """Test Robinhood capabilities (read-only)."""
-    caps = provider.get_brokerage_capabilities("Robinhood")
-
-    assert caps["supports_trading"] is False
-    assert caps["supports_options"] is False
-    assert caps["read_only"] is True
-    assert caps["connection_type"] == "oauth"
-
-
-def test_get_brokerage_capabilities_etrade(provider):
-    """Test E*TRADE capabilities (supports trading)."""
-    caps = provider.get_brokerage_capabilities("E*TRADE")
-
-    assert caps["supports_trading"] is True
-    assert caps["supports_options"] is True
-    assert caps["read_only"] is False
-    assert caps["connection_type"] == "oauth"
-
-
-def test_get_brokerage_capabilities_wealthsimple(provider):
-    """Test Wealthsimple capabilities."""
-    caps = provider.get_brokerage_capabilities("Wealthsimple")
-
-    assert caps["supports_trading"] is True
-    assert caps["supports_options"] is False
-    assert caps["read_only"] is False
-
-
-def test_get_brokerage_capabilities_unknown_brokerage(provider):
-    """Test unknown brokerage returns default capabilities."""
-    caps = provider.get_brokerage_capabilities("UnknownBroker")
-
-    # Default capabilities
-    assert caps["supports_trading"] is True
-    assert caps["supports_options"] is False
-    assert caps["read_only"] is False
-    assert caps["connection_type"] == "oauth"
+@pytest.mark.parametrize(
+    "brokerage,expected",
+    [
+        (
+            "Robinhood",
+            {
+                "supports_trading": False,
+                "supports_options": False,
+                "read_only": True,
+                "connection_type": "oauth",
+            },
+        ),
+        (
+            "E*TRADE",
+            {
+                "supports_trading": True,
+                "supports_options": True,
+                "read_only": False,
+                "connection_type": "oauth",
+            },
+        ),
+        (
+            "Wealthsimple",
+            {"supports_trading": True, "supports_options": False, "read_only": False},
+        ),
+        # Unknown brokerages fall back to the default capabilities
+        (
+            "UnknownBroker",
+            {
+                "supports_trading": True,
+                "supports_options": False,
+                "read_only": False,
+                "connection_type": "oauth",
+            },
+        ),
+    ],
+    ids=["robinhood_read_only", "etrade_trading", "wealthsimple", "unknown_default"],
+)
+def test_get_brokerage_capabilities(provider, brokerage, expected):
+    """Test brokerage capabilities lookup."""
+    caps = provider.get_brokerage_capabilities(brokerage)
+
+    assert {key: caps[key] for key in expected} == expected
 
 
 # Test helper methods
@@ -585,83 +505,71 @@ def test_transform_transaction(provider, mock_snaptrade_transaction):
     assert tx.fees == Decimal("1.50")
 
 
-def test_normalize_transaction_type_buy(provider):
-    """Test transaction type normalization for buy."""
-    assert provider._normalize_transaction_type("buy") == TransactionType.buy
-
-
-def test_normalize_transaction_type_sell(provider):
-    """Test transaction type normalization for sell."""
-    assert provider._normalize_transaction_type("sell") == TransactionType.sell
-
-
-def test_normalize_transaction_type_dividend(provider):
-    """Test transaction type normalization for dividend."""
-    assert provider._normalize_transaction_type("dividend") == TransactionType.dividend
-
-
-def test_normalize_transaction_type_unknown(provider):
-    """Test transaction type normalization for unknown type."""
-    assert provider._normalize_transaction_type("custom_type") == TransactionType.other
+@pytest.mark.parametrize(
+    "snaptrade_type,expected",
+    [
+        ("buy", TransactionType.buy),
+        ("sell", TransactionType.sell),
+        ("dividend", TransactionType.dividend),
+        ("custom_type", TransactionType.other),
+    ],
+)
+def test_normalize_transaction_type(provider, snaptrade_type, expected):
+    """Test transaction type normalization."""
+    assert provider._normalize_transaction_type(snaptrade_type) == expected
 
 
 # Test error transformation
 
 
-def test_transform_error_401(provider):
-    """Test 401 error transformation."""
-    mock_response = Mock()
-    mock_response.status_code = 401
-    mock_response.text = "Unauthorized"
-    mock_response.json.return_value = {"message": "Invalid credentials"}
-
-    error = httpx.HTTPStatusError(message="401", request=Mock(), response=mock_response)
-    transformed = provider._transform_error(error)
-
-    assert isinstance(transformed, ValueError)
-    assert "Invalid SnapTrade credentials" in str(transformed)
-
-
-def test_transform_error_429(provider):
-    """Test 429 rate limit error transformation."""
-    mock_response = Mock()
-    mock_response.status_code = 429
-    mock_response.text = "Rate limit exceeded"
-    mock_response.json.return_value = {"message": "Too many requests"}
-
-    error = httpx.HTTPStatusError(message="429", request=Mock(), response=mock_response)
-    transformed = provider._transform_error(error)
-
-    assert isinstance(transformed, ValueError)
-    assert "rate limit exceeded" in str(transformed)
-
-
-def test_transform_error_404(provider):
-    """Test 404 error transformation."""
-    mock_response = Mock()
-    mock_response.status_code = 404
-    mock_response.text = "Not found"
-    mock_response.json.side_effect = Exception("Not JSON")
-
-    error = httpx.HTTPStatusError(message="404", request=Mock(), response=mock_response)
-    transformed = provider._transform_error(error)
-
-    assert isinstance(transformed, ValueError)
-    assert "Resource not found" in str(transformed)
-
-
-def test_transform_error_500(provider):
-    """Test 500 error transformation."""
+@pytest.mark.parametrize(
+    "status,text,json_body,json_error,expected_cls,expected_substr",
+    [
+        (
+            401,
+            "Unauthorized",
+            {"message": "Invalid credentials"},
+            None,
+            ValueError,
+            "Invalid SnapTrade credentials",
+        ),
+        (
+            429,
+            "Rate limit exceeded",
+            {"message": "Too many requests"},
+            None,
+            ValueError,
+            "rate limit exceeded",
+        ),
+        (404, "Not found", None, Exception("Not JSON"), ValueError, "Resource not found"),
+        (
+            500,
+            "Internal server error",
+            {"message": "Server error"},
+            None,
+            Exception,
+            "SnapTrade API error (500)",
+        ),
+    ],
+    ids=["401", "429", "404_not_json", "500"],
+)
+def test_transform_error(
+    provider, status, text, json_body, json_error, expected_cls, expected_substr
+):
+    """Test HTTP error transformation."""
     mock_response = Mock()
-    mock_response.status_code = 500
-    mock_response.text = "Internal server error"
-    mock_response.json.return_value = {"message": "Server error"}
-
-    error = httpx.HTTPStatusError(message="500", request=Mock(), response=mock_response)
+    mock_response.status_code = status
+    mock_response.text = text
+    if json_error is not None:
+        mock_response.json.side_effect = json_error
+    else:
+        mock_response.json.return_value = json_body
+
+    error = httpx.HTTPStatusError(message=str(status), request=Mock(), response=mock_response)
     transformed = provider._transform_error(error)
 
-    assert isinstance(transformed, Exception)
-    assert "SnapTrade API error (500)" in str(transformed)
+    assert isinstance(transformed, expected_cls)
+    assert expected_substr in str(transformed)
 
 
 # Test async context manager
@@ -163,12 +163,12 @@ class TestAPITimeoutRecovery:
             nonlocal call_count
             call_count += 1
 
-            mock_response = AsyncMock()
+            mock_response = Mock()
 
             if "accounts" in url:
                 mock_response.status_code = 200
                 mock_response.raise_for_status = Mock()
-                mock_response.json = AsyncMock(
+                mock_response.json = Mock(
                     return_value=[
                         {"id": "acct_001", "name": "Test Account"},
                     ]
@@ -385,12 +385,12 @@ class TestTokenExpirationRace:
             nonlocal call_count
             call_count += 1
 
-            mock_response = AsyncMock()
+            mock_response = Mock()
 
             if "accounts" in url:
                 mock_response.status_code = 200
                 mock_response.raise_for_status = Mock()
-                mock_response.json = AsyncMock(
+                mock_response.json = Mock(
                     return_value=[
                         {"id": "acct_001"},
                         {"id": "acct_002"},
@@ -401,7 +401,7 @@ class TestTokenExpirationRace:
                 # First position fetch succeeds
                 mock_response.status_code = 200
                 mock_response.raise_for_status = Mock()
-                mock_response.json = AsyncMock(return_value=[])
+                mock_response.json = Mock(return_value=[])
                 return mock_response
             else:
                 # Second position fetch fails with 401 (token expired)
@@ -584,7 +584,7 @@ class TestHTTPErrorHandling:
         mock_response.json.return_value = {"error": "Rate limit exceeded"}
 
         with patch.object(provider.client, "get") as mock_get:
-            mock_response_obj = AsyncMock()
+            mock_response_obj = Mock()
             mock_response_obj.status_code = 429
             mock_response_obj.raise_for_status = Mock(
                 side_effect=httpx.HTTPStatusError(
@@ -970,14 +970,14 @@ class TestConcurrentRequestSafety:
             # Simulate some delay
             await asyncio.sleep(0.01)
 
-            mock_response = AsyncMock()
+            mock_response = Mock()
             mock_response.status_code = 200
             mock_response.raise_for_status = Mock()
 
             if "accounts" in url:
-                mock_response.json = AsyncMock(return_value=[{"id": "acct_001"}])
+                mock_response.json = Mock(return_value=[{"id": "acct_001"}])
             else:
-                mock_response.json = AsyncMock(return_value=[])
+                mock_response.json = Mock(return_value=[])
 
             return mock_response
 